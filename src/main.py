@@ -1,11 +1,17 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
 import logging
 from pathlib import Path
 
 from websum_to_git.bot import run_bot
 
+try:
+    import uvloop
+except ImportError:  # Windows 没有 uvloop，回退到标准 asyncio 事件循环
+    uvloop = None
+
 
 def main() -> None:
     parser = argparse.ArgumentParser(description="Telegram HTML → Obsidian → GitHub Bot")
@@ -21,6 +27,16 @@ def main() -> None:
         level=logging.INFO,
         format="%(asctime)s [%(levelname)s] %(name)s - %(message)s",
     )
+    # 格式中未使用线程/进程字段，关闭采集以减少每条日志记录的开销
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    # httpx 会为每次 getUpdates 长轮询打一条 INFO 日志，只保留警告以上
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
+    if uvloop is not None:
+        # run_polling 会复用当前线程的事件循环，提前设置即可让 Bot 跑在 uvloop 上
+        asyncio.set_event_loop(uvloop.new_event_loop())
 
     run_bot(Path(args.config))
 
@@ -1,16 +1,20 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import logging
+import os
 import re
+import tempfile
 import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from io import BytesIO
 from pathlib import Path
 from typing import Any
 
-from telegram import BotCommand, InlineKeyboardButton, InlineKeyboardMarkup, InputFile, Message, Update
+from cachetools import TTLCache
+from telegram import BotCommand, InlineKeyboardButton, InlineKeyboardMarkup, Message, Update
 from telegram.ext import (
     Application,
     ApplicationBuilder,
@@ -22,15 +26,26 @@ from telegram.ext import (
 )
 
 from .config import AppConfig, load_config
-from .fetchers import capture_screenshot, get_camoufox_browser_version
+from .fetchers import (
+    capture_screenshot,
+    close_camoufox,
+    close_parser_pool,
+    get_camoufox_browser_version,
+    warm_up_camoufox,
+)
 from .pipeline import HtmlToObsidianPipeline
 from .task_queue import ChatTaskQueueFullError, Job, TaskQueueFullError, TaskScheduler
 from .url_utils import strip_tracking_params
 
 logger = logging.getLogger(__name__)
 
-URL_REGEX = re.compile(r"https?://[^\s]+", re.IGNORECASE)
+# 协议名大小写直接展开为字符集，避免 IGNORECASE 对后续每个字符做大小写折叠
+URL_REGEX = re.compile(r"[Hh][Tt][Tt][Pp][Ss]?://\S+")
+_MAX_URL_SCAN_CHARS = 4096
 HEARTBEAT_PATH = Path("/tmp/websum_bot_heartbeat")
+_HEARTBEAT_INTERVAL_SECONDS = 60
+_DELETE_TARGETS_MAXSIZE = 10_000
+_DELETE_TARGETS_TTL_SECONDS = 24 * 60 * 60
 
 # Bot 命令定义
 BOT_COMMANDS = [
@@ -40,6 +55,15 @@ BOT_COMMANDS = [
     BotCommand("url2img", "网页截图 - 将网页转换为图片"),
 ]
 
+WELCOME_TEXT = (
+    "👋 欢迎使用 WebSum Bot！\n\n"
+    "请发送包含网页地址的消息，我会帮你：\n"
+    "• 自动抓取网页内容\n"
+    "• 使用 AI 生成摘要\n"
+    "• 同步笔记到 GitHub\n\n"
+    "输入 /help 查看所有可用命令"
+)
+
 HELP_TEXT = """📚 *WebSum Bot 命令列表*
 
 /start - 开始使用，显示欢迎信息
@@ -52,9 +76,19 @@ HELP_TEXT = """📚 *WebSum Bot 命令列表*
 • 多个任务会自动排队处理，可用 /status 查看状态
 • 使用 /url2img 命令可以获取网页的完整截图"""
 
+# 处理结果消息模板：按 pipeline 结果依次拼接
+RESULT_SUMMARIZED_TEMPLATE = "✅ 处理完成\n\n📁 文件: `{file_path}`"
+RESULT_RAW_TEMPLATE = "⚠️ 内容较短，已保存原文\n\n📁 文件: `{file_path}`"
+RESULT_COMMIT_TEMPLATE = "\n🔖 Commit: `{commit}`"
+RESULT_GITHUB_TEMPLATE = "\n\n📂 [GitHub 查看]({github_url})"
+
 
 def extract_first_url(text: str) -> str | None:
-    match = URL_REGEX.search(text)
+    # 绝大多数不含链接的消息直接被子串检查排除，无需进入正则匹配
+    if "://" not in text:
+        return None
+    # Telegram 单条消息最长 4096 字符，超出部分不再扫描
+    match = URL_REGEX.search(text, 0, _MAX_URL_SCAN_CHARS)
     return strip_tracking_params(match.group(0)) if match else None
 
 
@@ -66,22 +100,51 @@ class TelegramBotApp:
             max_queue_size=config.telegram.max_queue_size,
             max_queue_size_per_chat=config.telegram.max_queue_size_per_chat,
         )
+        # 整个 Bot 生命周期共用一个 pipeline，LLM/GitHub/Telegraph 客户端的连接池可跨任务复用
+        self._pipeline = HtmlToObsidianPipeline(config)
+        # 删除回调的 GitHub 请求使用独立小线程池，不与默认执行器上的其他阻塞任务争抢
+        self._delete_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="websum-delete")
+        # 删除按钮 request_id -> GitHub 文件路径；有界且一天后过期，未点击的记录不会无限累积
+        self._delete_targets: TTLCache[str, str] = TTLCache(
+            maxsize=_DELETE_TARGETS_MAXSIZE, ttl=_DELETE_TARGETS_TTL_SECONDS
+        )
+        self._heartbeat_task: asyncio.Task[None] | None = None
+        self._warm_up_task: asyncio.Task[None] | None = None
+
+    def start_heartbeat(self) -> None:
+        """在当前事件循环上启动心跳任务（需在 Application 启动后调用）。"""
+        self._heartbeat_task = asyncio.create_task(heartbeat_loop(), name="websum-heartbeat")
+
+    def start_warm_up(self) -> None:
+        """在后台预热浏览器，不阻塞 Bot 开始轮询（需在 Application 启动后调用）。"""
+        self._warm_up_task = asyncio.create_task(self.warm_up_browsers(), name="websum-warm-up")
+
+    async def warm_up_browsers(self) -> None:
+        """启动时预热常驻浏览器，首个抓取/截图请求无需等待浏览器冷启动；失败只记录日志。"""
+        futures = warm_up_camoufox(self._config.http.browser_workers)
+        results = await asyncio.gather(*(asyncio.wrap_future(f) for f in futures), return_exceptions=True)
+        errors = [result for result in results if isinstance(result, BaseException)]
+        if errors:
+            logger.warning("预热 Camoufox 浏览器失败，将在首个请求时再启动: %s", errors[0])
+        else:
+            logger.info("已预热 %d 个 Camoufox 浏览器", len(futures))
 
     async def shutdown(self) -> None:
+        for task in (self._heartbeat_task, self._warm_up_task):
+            if task is not None:
+                task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await task
         await self._scheduler.shutdown()
+        self._delete_executor.shutdown(wait=False)
+        # 关闭浏览器与解析进程池需等待线程/子进程退出，放到线程中执行，不阻塞事件循环
+        await asyncio.to_thread(close_camoufox)
+        await asyncio.to_thread(close_parser_pool)
 
     async def start(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:  # noqa: ARG002
         if not update.message:
             return
-        welcome_text = (
-            "👋 欢迎使用 WebSum Bot！\n\n"
-            "请发送包含网页地址的消息，我会帮你：\n"
-            "• 自动抓取网页内容\n"
-            "• 使用 AI 生成摘要\n"
-            "• 同步笔记到 GitHub\n\n"
-            "输入 /help 查看所有可用命令"
-        )
-        await update.message.reply_text(welcome_text)
+        await update.message.reply_text(WELCOME_TEXT)
 
     async def help_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:  # noqa: ARG002
         if not update.message:
@@ -110,8 +173,7 @@ class TelegramBotApp:
         if not update.message or not update.message.text:
             return
 
-        text = update.message.text.strip()
-        url = extract_first_url(text)
+        url = extract_first_url(update.message.text)
         if not url:
             await update.message.reply_text("未检测到有效的 http/https 地址，请在 /url2img 后附上网页链接。")
             return
@@ -126,10 +188,28 @@ class TelegramBotApp:
         async def on_start() -> None:
             await bot.edit_message_text(chat_id=chat_id, message_id=status_message.message_id, text="⏳ 开始生成截图……")
 
-        async def on_success(image_bytes: bytes) -> None:
-            image_file = InputFile(BytesIO(image_bytes), filename="webpage_screenshot.png")
+        async def run() -> Path:
+            # 截图在浏览器池线程中完成，这里只 await 结果，作为协程任务不占用调度线程池；
+            # PNG 由 Playwright 直接写入临时文件，发送时再以文件句柄上传
+            fd, name = tempfile.mkstemp(prefix="websum_screenshot_", suffix=".png")
+            os.close(fd)
+            image_path = Path(name)
+            try:
+                await capture_screenshot(url, max_browsers=self._config.http.browser_workers, path=image_path)
+            except BaseException:
+                image_path.unlink(missing_ok=True)
+                raise
+            return image_path
+
+        async def on_success(image_path: Path) -> None:
             try:
-                await bot.send_photo(chat_id=chat_id, photo=image_file, caption=f"网页截图: {url}")
+                with image_path.open("rb") as image_file:
+                    await bot.send_photo(
+                        chat_id=chat_id,
+                        photo=image_file,
+                        filename="webpage_screenshot.png",
+                        caption=f"网页截图: {url}",
+                    )
                 await bot.edit_message_text(
                     chat_id=chat_id, message_id=status_message.message_id, text="✅ 截图已生成并发送。"
                 )
@@ -140,6 +220,8 @@ class TelegramBotApp:
                     message_id=status_message.message_id,
                     text=f"❌ 截图已生成，但发送到 Telegram 失败: {exc}",
                 )
+            finally:
+                image_path.unlink(missing_ok=True)
 
         async def on_failure(exc: Exception) -> None:
             logger.exception("截图失败: %s", url)
@@ -158,7 +240,7 @@ class TelegramBotApp:
             status_message_id=status_message.message_id,
             created_at=datetime.now(),
             kind="screenshot",
-            run=lambda: capture_screenshot(url),
+            run=run,
             on_start=on_start,
             on_success=on_success,
             on_failure=on_failure,
@@ -189,8 +271,7 @@ class TelegramBotApp:
         if not update.message or not update.message.text:
             return
 
-        text = update.message.text.strip()
-        url = extract_first_url(text)
+        url = extract_first_url(update.message.text)
         if not url:
             await update.message.reply_text("未检测到有效的 http/https 地址，请发送包含 HTML 网页地址的文本。")
             return
@@ -198,7 +279,6 @@ class TelegramBotApp:
         status_message = await update.message.reply_text("已接收任务，正在入队排队中……")
 
         bot = context.bot
-        bot_data = context.bot_data
         chat_id = update.effective_chat.id if update.effective_chat else None
         if chat_id is None:
             return
@@ -212,21 +292,23 @@ class TelegramBotApp:
             pipeline_result = result
 
             # 根据是否进行了 LLM 总结，显示不同的状态
-            if pipeline_result.summarized:
-                message = f"✅ 处理完成\n\n📁 文件: `{pipeline_result.file_path}`"
-            else:
-                message = f"⚠️ 内容较短，已保存原文\n\n📁 文件: `{pipeline_result.file_path}`"
-
+            fields = {
+                "file_path": pipeline_result.file_path,
+                "commit": (pipeline_result.commit_hash or "")[:7],
+                "github_url": pipeline_result.github_url,
+            }
+            template = RESULT_SUMMARIZED_TEMPLATE if pipeline_result.summarized else RESULT_RAW_TEMPLATE
             if pipeline_result.commit_hash:
-                message += f"\n🔖 Commit: `{pipeline_result.commit_hash[:7]}`"
+                template += RESULT_COMMIT_TEMPLATE
             if pipeline_result.github_url:
-                message += f"\n\n📂 [GitHub 查看]({pipeline_result.github_url})"
+                template += RESULT_GITHUB_TEMPLATE
+            message = template.format_map(fields)
 
             # 添加删除按钮
             keyboard = None
             if pipeline_result.file_path and pipeline_result.commit_hash:
-                request_id = str(uuid.uuid4())
-                bot_data[f"del:{request_id}"] = pipeline_result.file_path
+                request_id = uuid.uuid4().hex[:12]
+                self._delete_targets[request_id] = pipeline_result.file_path
                 keyboard = [[InlineKeyboardButton("🗑️ 删除本次提交", callback_data=f"del:{request_id}")]]
 
             reply_markup = InlineKeyboardMarkup(keyboard) if keyboard else None
@@ -260,17 +342,13 @@ class TelegramBotApp:
                 disable_web_page_preview=True,
             )
 
-        def run() -> Any:
-            pipeline = HtmlToObsidianPipeline(self._config)
-            return pipeline.process_url(url)
-
         job = Job(
             job_id=str(uuid.uuid4()),
             chat_id=chat_id,
             status_message_id=status_message.message_id,
             created_at=datetime.now(),
             kind="summary",
-            run=run,
+            run=lambda: self._pipeline.process_url(url),
             on_start=on_start,
             on_success=on_success,
             on_failure=on_failure,
@@ -314,7 +392,7 @@ class TelegramBotApp:
             return
 
         request_id = data.split(":", 1)[1]
-        file_path = context.bot_data.get(f"del:{request_id}")
+        file_path = self._delete_targets.get(request_id)
 
         if not file_path:
             # 此时 query.message 既然已确认是 Message，就可以放心访问 text
@@ -323,10 +401,11 @@ class TelegramBotApp:
 
         try:
             # 执行删除
-            await asyncio.to_thread(HtmlToObsidianPipeline(self._config).delete_file, file_path)
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(self._delete_executor, self._pipeline.delete_file, file_path)
 
-            # 清理 bot_data
-            del context.bot_data[f"del:{request_id}"]
+            # 清理删除记录
+            self._delete_targets.pop(request_id, None)
 
             # 更新消息文本
             # 移除按钮，并追加已删除提示
@@ -343,8 +422,28 @@ class TelegramBotApp:
             await query.edit_message_text(text=f"{query.message.text}\n\n❌ 删除失败: {exc}")
 
 
-async def heartbeat_job(context: ContextTypes.DEFAULT_TYPE) -> None:  # noqa: ARG001
-    HEARTBEAT_PATH.write_text(str(int(time.time())), encoding="utf-8")
+async def heartbeat_loop(interval: float = _HEARTBEAT_INTERVAL_SECONDS) -> None:
+    # 普通 asyncio 任务即可满足定时需求，无需引入 JobQueue/APScheduler；
+    # 心跳文件只打开一次，之后每次仅 pwrite 覆盖时间戳（秒级时间戳定长，无需再截断）；
+    # 内容仍是纯文本时间戳，Docker 健康检查的读取方式不变。
+    # 写入失败（磁盘满、IO 错误等）时记录日志并关闭文件，下一轮重新打开，心跳任务不退出
+    fd: int | None = None
+    try:
+        while True:
+            try:
+                if fd is None:
+                    fd = os.open(HEARTBEAT_PATH, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+                os.pwrite(fd, str(int(time.time())).encode("ascii"), 0)
+            except OSError:
+                logger.exception("写入心跳文件失败: %s", HEARTBEAT_PATH)
+                if fd is not None:
+                    with contextlib.suppress(OSError):
+                        os.close(fd)
+                    fd = None
+            await asyncio.sleep(interval)
+    finally:
+        if fd is not None:
+            os.close(fd)
 
 
 async def post_init(application: Application) -> None:
@@ -358,27 +457,41 @@ def run_bot(config_path: str | Path = "config.yaml") -> None:
     app_config = config
     bot_app = TelegramBotApp(app_config)
 
+    async def on_startup(application: Application) -> None:
+        bot_app.start_heartbeat()
+        bot_app.start_warm_up()
+        await post_init(application)
+
     async def on_shutdown(application: Application) -> None:  # noqa: ARG001
         await bot_app.shutdown()
 
-    app = (
-        ApplicationBuilder()
-        .token(app_config.telegram.bot_token)
-        .post_init(post_init)
-        .post_shutdown(on_shutdown)
-        .build()
-    )
+    builder = ApplicationBuilder().token(app_config.telegram.bot_token).post_init(on_startup).post_shutdown(on_shutdown)
+    # 使用本地 telegram-bot-api 时，请求与截图上传走回环网络，且不受官方 50MB 上传限制
+    if app_config.telegram.api_base_url:
+        builder = builder.base_url(app_config.telegram.api_base_url)
+    if app_config.telegram.api_file_url:
+        builder = builder.base_file_url(app_config.telegram.api_file_url)
+    app = builder.build()
 
     app.add_handler(CommandHandler("start", bot_app.start))
     app.add_handler(CommandHandler("help", bot_app.help_command))
     app.add_handler(CommandHandler("status", bot_app.status_command))
     app.add_handler(CommandHandler("url2img", bot_app.url2img))
-    app.add_handler(CallbackQueryHandler(bot_app.handle_delete_callback, pattern="^del:"))
+    # 删除回调要等待 GitHub 请求完成，非阻塞执行以免拖住后续更新的处理；
+    # 摘要/截图消息本身只负责入队，保持阻塞以维持同一会话的入队顺序
+    app.add_handler(CallbackQueryHandler(bot_app.handle_delete_callback, pattern="^del:", block=False))
     app.add_handler(MessageHandler(filters.TEXT & ~filters.COMMAND, bot_app.handle_message))
 
-    job_queue = app.job_queue
-    if job_queue is None:
-        raise RuntimeError("JobQueue is not configured")
-    job_queue.run_repeating(heartbeat_job, interval=60, first=0)
+    # 长轮询：空闲时由 Telegram 服务端挂起连接，减少 getUpdates 次数；只订阅实际处理的更新类型
+    app.run_polling(
+        timeout=50,
+        allowed_updates=[Update.MESSAGE, Update.CALLBACK_QUERY],
+    )
+
 
-    app.run_polling()
+__all__ = [
+    "HEARTBEAT_PATH",
+    "TelegramBotApp",
+    "extract_first_url",
+    "run_bot",
+]
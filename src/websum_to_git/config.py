@@ -1,11 +1,15 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 import yaml
 
+# 优先使用 libyaml 的 C 实现解析配置，未编译 libyaml 时回退纯 Python 版本
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 @dataclass
 class LLMConfig:
@@ -36,12 +40,21 @@ class TelegramConfig:
     max_queue_size: int = 50
     # 单个 Chat pending 队列上限（不含 running）
     max_queue_size_per_chat: int = 10
+    # 可选：自建 telegram-bot-api 服务地址，缺省使用官方 api.telegram.org
+    api_base_url: str | None = None
+    api_file_url: str | None = None
 
 
 @dataclass
 class HttpConfig:
     # 控制抓取网页时是否校验证书；正常情况下应保持为 True
     verify_ssl: bool = True
+    # HTML 正文解析（Readability/markdownify，CPU 密集）使用的独立进程池大小
+    parser_workers: int = 2
+    # 常驻 Camoufox 浏览器数量（每个浏览器独占一个工作线程，抓取与截图共用）
+    browser_workers: int = 2
+    # 同一 URL 抓取结果的缓存时间（秒），0 表示不缓存
+    page_cache_ttl: int = 900
 
 
 @dataclass
@@ -96,12 +109,21 @@ def _build_llm_config(llm_raw: dict[str, Any]) -> LLMConfig:
 
 
 def load_config(path: str | Path) -> AppConfig:
+    """加载并校验配置文件。
+
+    同一文件在未修改（mtime 不变）时直接返回缓存的 AppConfig，调用方不应修改返回对象。
+    """
     path = Path(path)
     if not path.exists():
         raise FileNotFoundError(f"配置文件不存在: {path}")
 
+    return _load_config_cached(path.resolve(), path.stat().st_mtime_ns)
+
+
+@lru_cache(maxsize=8)
+def _load_config_cached(path: Path, mtime_ns: int) -> AppConfig:  # noqa: ARG001 - mtime 仅作为缓存键
     with path.open("r", encoding="utf-8") as f:
-        raw = yaml.safe_load(f) or {}
+        raw = yaml.load(f, Loader=_YAML_LOADER) or {}
 
     telegram_raw = raw.get("telegram", {})
     llm_raw = raw.get("llm", {})
@@ -115,6 +137,8 @@ def load_config(path: str | Path) -> AppConfig:
         max_concurrent_jobs=int(telegram_raw.get("max_concurrent_jobs", 2)),
         max_queue_size=int(telegram_raw.get("max_queue_size", 50)),
         max_queue_size_per_chat=int(telegram_raw.get("max_queue_size_per_chat", 10)),
+        api_base_url=telegram_raw.get("api_base_url") or None,
+        api_file_url=telegram_raw.get("api_file_url") or None,
     )
     if telegram.max_concurrent_jobs <= 0:
         raise ValueError("配置非法: telegram.max_concurrent_jobs 必须 > 0")
@@ -135,7 +159,16 @@ def load_config(path: str | Path) -> AppConfig:
 
     http = HttpConfig(
         verify_ssl=http_raw.get("verify_ssl", True),
+        parser_workers=int(http_raw.get("parser_workers", 2)),
+        browser_workers=int(http_raw.get("browser_workers", 2)),
+        page_cache_ttl=int(http_raw.get("page_cache_ttl", 900)),
     )
+    if http.parser_workers <= 0:
+        raise ValueError("配置非法: http.parser_workers 必须 > 0")
+    if http.browser_workers <= 0:
+        raise ValueError("配置非法: http.browser_workers 必须 > 0")
+    if http.page_cache_ttl < 0:
+        raise ValueError("配置非法: http.page_cache_ttl 必须 >= 0")
 
     defuddle = DefuddleConfig(
         enabled=bool(defuddle_raw.get("enabled", True)),
@@ -14,14 +14,21 @@
 from __future__ import annotations
 
 import logging
+import re
+import threading
+import weakref
 from collections.abc import Callable
+from dataclasses import replace
 from typing import TYPE_CHECKING
 
+from cachetools import TTLCache
+
 from ..url_utils import strip_tracking_params
-from .camoufox_helper import get_camoufox_browser_version
+from .camoufox_helper import close_camoufox, get_camoufox_browser_version, warm_up_camoufox
 from .defuddle import fetch_defuddle
 from .github import fetch_github
 from .headless import fetch_headless
+from .html_utils import close_parser_pool
 from .screenshot import capture_screenshot
 
 # 重新导出以保持向后兼容
@@ -38,16 +45,34 @@ logger = logging.getLogger(__name__)
 MIN_CONTENT_FOR_RETRY = 500
 MIN_CONTENT_FOR_SUMMARY = 500
 
+# 抓取结果短期缓存：同一 URL 在 TTL（http.page_cache_ttl）内重复提交时直接复用，省去浏览器抓取与解析
+_PAGE_CACHE_MAXSIZE = 128
+_page_cache: TTLCache[str, PageContent] = TTLCache(maxsize=_PAGE_CACHE_MAXSIZE, ttl=900)
+_page_cache_lock = threading.Lock()
+# 按 URL 加锁合并并发抓取；锁无人持有后自动回收
+_url_locks: weakref.WeakValueDictionary[str, threading.Lock] = weakref.WeakValueDictionary()
+
 
-# 显式路由表: (匹配函数, 处理函数)
-# 顺序很重要：先匹配到的先执行。
-ROUTERS: list[tuple[Callable[[str], bool], Callable[[str, AppConfig], PageContent]]] = [
-    # 1. 专用 Fetchers (高优先级)
-    (lambda u: "github.com" in u or "gist.github.com" in u, fetch_github),
+# 显式路由表: (路由名, 匹配正则, 处理函数)
+# 导入时合并为一个命名分组交替正则，每个 URL 只扫描一遍；
+# URL 中最先出现的匹配生效，同一位置多条命中时按表中顺序优先。
+ROUTERS: list[tuple[str, str, Callable[[str, AppConfig], PageContent]]] = [
+    # 1. 专用 Fetchers (高优先级)，github\.com 同时覆盖 gist.github.com
+    ("github", r"github\.com", fetch_github),
     # Twitter 现在由 headless fetcher 的策略处理
     # 2. 兜底 Fetchers (如果在特定配置下需要优先使用某些通用 fetcher，可调整顺序)
     # 目前默认逻辑是：如果没有命中专用 fetcher，直接进入 fetch_page 的兜底逻辑。
 ]
+_ROUTE_RE = re.compile("|".join(f"(?P<{name}>{pattern})" for name, pattern, _ in ROUTERS))
+_ROUTE_HANDLERS = {name: handler for name, _, handler in ROUTERS}
+
+
+def _match_route(url: str) -> Callable[[str, AppConfig], PageContent] | None:
+    """返回 URL 命中的专用 Fetcher，未命中返回 None。"""
+    match = _ROUTE_RE.search(url)
+    if match is None or match.lastgroup is None:
+        return None
+    return _ROUTE_HANDLERS[match.lastgroup]
 
 
 def _try_defuddle_fallback(url: str, config: AppConfig, *, failed_fetcher: str) -> PageContent | None:
@@ -83,16 +108,51 @@ def fetch_page(url: str, config: AppConfig) -> PageContent:
     if normalized_url != url:
         logger.info("已移除 URL 中的追踪参数: %s -> %s", url, normalized_url)
 
+    ttl = config.http.page_cache_ttl
+    if ttl <= 0:
+        return _fetch_page_uncached(normalized_url, config)
+
+    with _page_cache_lock:
+        url_lock = _url_locks.setdefault(normalized_url, threading.Lock())
+
+    # 同一 URL 的并发请求只抓取一次，其余等待后直接命中缓存
+    with url_lock:
+        with _page_cache_lock:
+            cached = _get_page_cache(ttl).get(normalized_url)
+        if cached is not None:
+            logger.info("命中抓取缓存: %s", normalized_url)
+            return _copy_page(cached)
+
+        page = _fetch_page_uncached(normalized_url, config)
+        with _page_cache_lock:
+            _get_page_cache(ttl)[normalized_url] = page
+        return _copy_page(page)
+
+
+def _copy_page(page: PageContent) -> PageContent:
+    """复制缓存中的页面，避免调用方修改影响缓存；除 extra_meta 外字段均为不可变字符串。"""
+    return replace(page, extra_meta=dict(page.extra_meta))
+
+
+def _get_page_cache(ttl: int) -> TTLCache[str, PageContent]:
+    """返回与配置 TTL 一致的抓取缓存，TTL 变化时重建（调用方需持有 _page_cache_lock）。"""
+    global _page_cache
+    if _page_cache.ttl != ttl:
+        _page_cache = TTLCache(maxsize=_PAGE_CACHE_MAXSIZE, ttl=ttl)
+    return _page_cache
+
+
+def _fetch_page_uncached(normalized_url: str, config: AppConfig) -> PageContent:
+    """按路由表抓取已规范化的 URL，不经过缓存。"""
     # 1. 尝试匹配专用路由
-    for matcher, handler in ROUTERS:
-        if matcher(normalized_url):
-            try:
-                logger.debug("URL '%s' 匹配到专用 Fetcher: %s", normalized_url, handler.__name__)
-                return _normalize_page_urls(handler(normalized_url, config))
-            except Exception as exc:
-                logger.warning("专用 Fetcher %s 失败: %s，尝试兜底...", handler.__name__, exc)
-                # 专用 Fetcher 失败后，继续执行，尝试兜底逻辑
-                break
+    handler = _match_route(normalized_url)
+    if handler is not None:
+        try:
+            logger.debug("URL '%s' 匹配到专用 Fetcher: %s", normalized_url, handler.__name__)
+            return _normalize_page_urls(handler(normalized_url, config))
+        except Exception as exc:
+            # 专用 Fetcher 失败后，继续执行，尝试兜底逻辑
+            logger.warning("专用 Fetcher %s 失败: %s，尝试兜底...", handler.__name__, exc)
 
     # 2. 使用默认 HeadlessFetcher 兜底抓取
     logger.info("使用默认 HeadlessFetcher 兜底抓取: %s", normalized_url)
@@ -148,7 +208,10 @@ __all__ = [
     "MIN_CONTENT_FOR_SUMMARY",
     "PageContent",
     "capture_screenshot",
+    "close_camoufox",
+    "close_parser_pool",
     "fetch_page",
     "fetch_headless",
     "get_camoufox_browser_version",
+    "warm_up_camoufox",
 ]
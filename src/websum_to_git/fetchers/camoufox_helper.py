@@ -2,20 +2,36 @@
 
 from __future__ import annotations
 
-import asyncio
+import atexit
 import contextlib
+import functools
 import logging
+import queue
+import re
 import threading
 from collections.abc import Callable
-from typing import Any, TypeVar
+from concurrent.futures import Future
+from typing import Any
 
-from .structs import FetchError
+from .structs import DEFAULT_BLOCKED_RESOURCES, FetchError, ScrollMode
 
 logger = logging.getLogger(__name__)
 
 _camoufox_cls: type | None = None
 _playwright_timeout_error: type[Exception] | None = None
-T = TypeVar("T")
+_browser_pool: _BrowserPool | None = None
+_browser_pool_lock = threading.Lock()
+# 单个常驻浏览器最多处理的页面数，超过后重启
+_MAX_PAGES_PER_BROWSER = 50
+# 预热时等待所有浏览器启动完成的最长时间（秒）
+_WARM_UP_TIMEOUT_SECONDS = 120
+# 各类子资源常见的扩展名：按 URL 模式拦截，只有命中的请求才会交给 Python 处理，
+# 脚本、样式、XHR 等不再逐个绕道工作线程调用 continue_()
+_RESOURCE_EXTENSIONS: dict[str, tuple[str, ...]] = {
+    "image": ("png", "jpe?g", "gif", "webp", "avif", "svg", "ico", "bmp"),
+    "media": ("mp4", "webm", "mov", "mp3", "m4a", "ogg", "wav", "m3u8"),
+    "font": ("woff2?", "ttf", "otf", "eot"),
+}
 
 
 def _describe_runtime_error(exc: Exception) -> str:
@@ -82,173 +98,499 @@ def _ensure_camoufox() -> tuple[type, type[Exception] | None]:
     return _camoufox_cls, _playwright_timeout_error
 
 
+def compact_js(js: str) -> str:
+    """压缩页面脚本：去掉缩进、空行与整行 ``//`` 注释。
+
+    保留换行，避免破坏 JS 的自动分号插入；在模块导入时调用一次，减少每次 evaluate 传给浏览器的脚本体积。
+    """
+    lines = (line.strip() for line in js.splitlines())
+    return "\n".join(line for line in lines if line and not line.startswith("//"))
+
+
+# 逐屏滚动，参数由 evaluate 传入
+_AUTO_SCROLL_JS = compact_js(
+    """
+async ({ step, maxIterations, baseDelay }) => {
+    // 如果未指定 step，则使用视口高度，或默认 800
+    const scrollStep = step || window.innerHeight || 800;
+    const pageHeight = () => Math.max(
+        document.body.scrollHeight,
+        document.documentElement.scrollHeight,
+        0
+    );
+    const sleep = (ms) => new Promise((resolve) => setTimeout(resolve, ms));
+
+    let position = 0;
+    let lastHeight = pageHeight();
+    let stableRounds = 0;
+
+    for (let i = 0; i < maxIterations; i++) {
+        position = Math.min(position + scrollStep, lastHeight);
+        window.scrollTo(0, position);
+
+        // 随机化延迟，模拟人类行为
+        await sleep(baseDelay + Math.random() * baseDelay);
+
+        const height = pageHeight();
+        if (position >= height) {
+            // 已到底部：高度不再增长说明懒加载已完成
+            stableRounds = height > lastHeight ? 0 : stableRounds + 1;
+            if (stableRounds >= 2) {
+                break;
+            }
+        }
+        lastHeight = height;
+    }
+
+    // 确保最后滚动到底部
+    window.scrollTo(0, pageHeight());
+}
+"""
+)
+
+
 def _auto_scroll(
     page: Any,
     step: int | None = None,
-    max_iterations: int = 50,
-    base_delay_ms: int = 300,
+    max_iterations: int = 15,
+    base_delay_ms: int = 150,
 ) -> None:
     """自动滚动 API，将配置参数透传给 JS 执行。
 
+    按步长向下滚动；到达底部后若页面高度连续两轮不再增长即提前结束，
+    静态页面无需跑满全部迭代。
+
     Args:
         page: Playwright/Camoufox Page 对象
-        step: 每次滚动的像素步长。默认 None (使用视口高度的一半)
+        step: 每次滚动的像素步长。默认 None (使用视口高度)
         max_iterations: 最大滚动次数
         base_delay_ms: 每次滚动的基本等待时间(ms)
     """
-    # 使用 Python 参数注入 JS，而不是拼接字符串
-    js_script = """
-    async ({ step, maxIterations, baseDelay }) => {
-        return new Promise((resolve) => {
-            // 如果未指定 step，则使用视口高度的一半，或默认 400
-            const scrollStep = step || (window.innerHeight / 2) || 400;
-            let position = 0;
-            let iterations = 0;
-
-            const scrollLoop = () => {
-                const maxScroll = Math.max(
-                    document.body.scrollHeight,
-                    document.documentElement.scrollHeight,
-                    0
-                );
-                
-                iterations++;
-                
-                // 判断是否还有滚动空间以及是否达到最大迭代次数
-                if (position < maxScroll && iterations < maxIterations) {
-                    window.scrollTo(0, position);
-                    position += scrollStep;
-                    
-                    // 随机化延迟，模拟人类行为
-                    const randomDelay = Math.random() * 500;
-                    setTimeout(scrollLoop, baseDelay + randomDelay);
-                } else {
-                    // 确保最后滚动到底部
-                    window.scrollTo(0, maxScroll);
-                    resolve();
-                }
-            };
-            scrollLoop();
-        });
-    }
-    """  # noqa: W293
 
     try:
         # 传递参数字典给 evaluate
-        page.evaluate(js_script, {"step": step, "maxIterations": max_iterations, "baseDelay": base_delay_ms})
+        # 使用 Python 参数注入 JS，而不是拼接字符串
+        page.evaluate(_AUTO_SCROLL_JS, {"step": step, "maxIterations": max_iterations, "baseDelay": base_delay_ms})
     except Exception as e:
         logger.warning("页面滚动执行出错 (非致命): %s", e)
 
 
-def _run_in_fresh_thread[T](task: Callable[[], T]) -> T:
-    """在新线程执行 Camoufox 任务，隔离已有事件循环。"""
+# 把懒加载图片/iframe 改为立即加载，再一次性滚动到底部
+_SCROLL_TO_BOTTOM_JS = compact_js(
+    """
+() => {
+    document.querySelectorAll('img[loading="lazy"], iframe[loading="lazy"]').forEach(el => { el.loading = "eager"; });
+    window.scrollTo(0, Math.max(document.body.scrollHeight, document.documentElement.scrollHeight));
+}
+"""
+)
+
+
+@functools.lru_cache(maxsize=8)
+def _blocked_url_pattern(block_resources: frozenset[str]) -> re.Pattern[str] | None:
+    """把要拦截的资源类型转换为按扩展名匹配的 URL 正则，没有可匹配的扩展名时返回 None。"""
+
+    extensions = [ext for kind in sorted(block_resources) for ext in _RESOURCE_EXTENSIONS.get(kind, ())]
+    if not extensions:
+        return None
+    return re.compile(rf"\.(?:{'|'.join(extensions)})(?:[?#]|$)", re.IGNORECASE)
 
-    result: dict[str, Any] = {}
 
-    def runner() -> None:
+def _scroll_to_bottom(page: Any, playwright_timeout_error: type[Exception] | None, *, wait_networkidle: bool) -> None:
+    """一次跳到页面底部触发懒加载，代替逐屏滚动的固定等待。
+
+    需要等资源加载完成时（如截图）等待网络空闲，否则只留一小段时间给脚本插入懒加载内容。
+    """
+    try:
+        page.evaluate(_SCROLL_TO_BOTTOM_JS)
+    except Exception as e:
+        logger.warning("页面滚动执行出错 (非致命): %s", e)
+        return
+    if wait_networkidle and playwright_timeout_error:
+        with contextlib.suppress(playwright_timeout_error):
+            page.wait_for_load_state("networkidle", timeout=8000)
+    else:
+        page.wait_for_timeout(500)
+
+
+class _BrowserPool:
+    """常驻 Camoufox 浏览器池。
+
+    Playwright sync API 的对象绑定在创建它的线程上，浏览器无法跨线程出借，
+    因此池内每个工作线程各自持有一个惰性启动的浏览器，任务投递到共享队列，
+    由空闲线程取出后在自己的浏览器上执行。浏览器启动一次后长期复用，
+    并始终使用同一个 BrowserContext（共享 Cookie 与 localStorage），
+    每个任务只新建/关闭自己的页面。
+    """
+
+    def __init__(self, size: int) -> None:
+        self._size = size
+        self._tasks: queue.SimpleQueue[tuple[Callable[[Any], Any], Future[Any]] | None] = queue.SimpleQueue()
+        self._threads: list[threading.Thread] = []
+        self._lock = threading.Lock()
+
+    def submit[R](self, task: Callable[[Any], R]) -> Future[R]:
+        """把任务投递给池内空闲的浏览器线程，返回可等待的 Future；任务参数为该浏览器的常驻上下文。"""
+
+        future: Future[R] = Future()
+        with self._lock:
+            if not self._threads:
+                for index in range(self._size):
+                    thread = threading.Thread(target=self._worker, name=f"camoufox-worker-{index}", daemon=True)
+                    thread.start()
+                    self._threads.append(thread)
+        self._tasks.put((task, future))
+        return future
+
+    def run[R](self, task: Callable[[Any], R]) -> R:
+        """在池内某个浏览器上执行任务并阻塞等待结果。"""
+
+        return self.submit(task).result()
+
+    def warm_up(self) -> list[Future[None]]:
+        """让每个工作线程各自提前启动浏览器，返回对应的 Future 列表。
+
+        预热任务在屏障处互相等待，保证 size 个任务分别落在不同线程上；
+        任一浏览器启动失败时中止屏障，其余线程不必等到超时。
+        """
+
+        barrier = threading.Barrier(self._size)
+
+        def task(_context: Any) -> None:
+            barrier.wait(timeout=_WARM_UP_TIMEOUT_SECONDS)
+
+        futures = [self.submit(task) for _ in range(self._size)]
+        for future in futures:
+            future.add_done_callback(lambda f: barrier.abort() if f.exception() else None)
+        return futures
+
+    def close(self) -> None:
+        """通知所有工作线程关闭各自的浏览器并退出。"""
+
+        with self._lock:
+            threads, self._threads = self._threads, []
+        for _ in threads:
+            self._tasks.put(None)
+        for thread in threads:
+            thread.join(timeout=10)
+
+    def _worker(self) -> None:
+        manager: Any = None
+        browser: Any = None
+        context: Any = None
+        # 本线程浏览器上下文的 Cookie/localStorage 快照，只保存在内存中，浏览器重启后恢复
+        storage_state: dict[str, Any] | None = None
+        served = 0
+
         try:
-            result["value"] = task()
-        except BaseException as exc:  # noqa: BLE001
-            result["error"] = exc
+            while (item := self._tasks.get()) is not None:
+                task, future = item
+                if not future.set_running_or_notify_cancel():
+                    continue
+                # 长期运行的浏览器内存会逐渐上涨，服务一定数量的页面后重启
+                if served >= _MAX_PAGES_PER_BROWSER:
+                    logger.info("Camoufox 浏览器已处理 %d 个页面，重启以回收内存", served)
+                    storage_state = _close_browser(manager, context) or storage_state
+                    manager = browser = context = None
+                if browser is None:
+                    served = 0
+                    logger.info("启动常驻 Camoufox 浏览器: %s", threading.current_thread().name)
+                    try:
+                        manager, browser, context = _launch_browser(storage_state)
+                    except BaseException as exc:  # noqa: BLE001
+                        # 启动失败时 _launch_browser 已关闭半启动的实例，下一个任务重新启动
+                        future.set_exception(exc)
+                        continue
+                try:
+                    served += 1
+                    future.set_result(task(context))
+                except BaseException as exc:  # noqa: BLE001
+                    future.set_exception(exc)
+                    # 浏览器崩溃或断开时丢弃，下一个任务重新启动
+                    if browser is not None and not browser.is_connected():
+                        logger.warning("Camoufox 浏览器已断开，下次任务将重新启动")
+                        _close_browser(manager, None)
+                        manager = browser = context = None
+        finally:
+            _close_browser(manager, context)
+
+
+def _launch_browser(storage_state: dict[str, Any] | None) -> tuple[Any, Any, Any]:
+    """启动 Camoufox 浏览器并创建常驻上下文，返回 (manager, browser, context)。
+
+    浏览器启动或上下文创建任一步失败都视为启动失败：关闭已启动的部分后抛出异常。
+    """
 
-    thread = threading.Thread(target=runner, name="camoufox-worker", daemon=True)
-    thread.start()
-    thread.join()
+    camoufox_cls, _ = _ensure_camoufox()
+    manager = camoufox_cls(
+        geoip=True,
+        config={"humanize": True, "humanize:maxTime": 1.5, "humanize:minTime": 0.5},
+    )
+    try:
+        browser = manager.__enter__()
+        return manager, browser, _new_context(browser, storage_state)
+    except BaseException:
+        _close_browser(manager, None)
+        raise
 
-    if "error" in result:
-        raise result["error"]  # type: ignore[misc]
-    return result["value"]  # type: ignore[return-value]
 
+def _new_context(browser: Any, storage_state: dict[str, Any] | None) -> Any:
+    """创建常驻浏览器上下文，传入本线程的内存快照时恢复 Cookie/localStorage。"""
 
-def fetch_with_camoufox(
+    if storage_state is not None:
+        try:
+            return browser.new_context(storage_state=storage_state)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("恢复 Camoufox 浏览器状态失败，使用空白上下文: %s", exc)
+    return browser.new_context()
+
+
+def _close_browser(manager: Any, context: Any) -> dict[str, Any] | None:
+    """关闭浏览器及其 Playwright 实例，返回关闭前上下文的内存状态快照；异常只记录日志。"""
+
+    storage_state = None
+    if context is not None:
+        try:
+            storage_state = context.storage_state()
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("保存 Camoufox 浏览器状态失败: %s", exc)
+    if manager is not None:
+        try:
+            manager.__exit__(None, None, None)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("关闭 Camoufox 浏览器失败: %s", exc)
+    return storage_state
+
+
+def _get_browser_pool(max_browsers: int) -> _BrowserPool:
+    """惰性创建浏览器池，大小以首次调用时的配置为准；进程退出时关闭所有浏览器。"""
+
+    global _browser_pool
+
+    with _browser_pool_lock:
+        if _browser_pool is None:
+            _browser_pool = _BrowserPool(max_browsers)
+            atexit.register(_browser_pool.close)
+        return _browser_pool
+
+
+def close_camoufox() -> None:
+    """关闭浏览器池中的全部常驻浏览器；之后的请求会按需重新创建浏览器池。"""
+
+    global _browser_pool
+
+    with _browser_pool_lock:
+        pool, _browser_pool = _browser_pool, None
+    if pool is not None:
+        pool.close()
+
+
+def warm_up_camoufox(max_browsers: int) -> list[Future[None]]:
+    """预先启动浏览器池中的全部浏览器，避免首个请求承担浏览器冷启动耗时。"""
+
+    return _get_browser_pool(max_browsers).warm_up()
+
+
+def build_page_task(
     url: str,
     *,
     timeout: int,
     wait_selector: str | None = None,
-    scroll: bool = True,
+    scroll: ScrollMode = True,
+    wait_networkidle: bool = False,
+    block_resources: frozenset[str] | None = DEFAULT_BLOCKED_RESOURCES,
     post_process: Callable[[Any], None] | None = None,
     extract: Callable[[Any], Any] | None = None,
-) -> tuple[str, str, Any | None]:
-    """启动 Camoufox 抓取页面并返回 HTML/最终 URL/自定义数据。
+) -> Callable[[Any], tuple[str, str, Any | None]]:
+    """构造在浏览器池中执行的页面任务：导航、等待、处理后返回 HTML/最终 URL/自定义数据。
+
+    抓取与截图共用这一套页面加载流程，差异只体现在参数与 ``extract`` 上。
 
     Args:
         url: 目标 URL
         timeout: 超时时间（秒）
         wait_selector: 可选，等待指定 selector 出现
-        scroll: 是否滚动页面以触发懒加载
+        scroll: 滚动方式：True 跳到底部并强制加载懒加载资源，"incremental" 逐屏滚动，False 不滚动
+        wait_networkidle: 是否额外等待网络空闲；带统计信标的站点往往等满超时，默认关闭
+        block_resources: 在浏览器中直接拦截的子资源类型（默认图片/媒体/字体，按 URL 扩展名匹配），None 表示不拦截
         post_process: 可选，对页面执行额外处理（如移除弹窗）
-        extract: 可选，从页面提取结构化数据
+        extract: 可选，从页面提取结构化数据（如截图）
     """
 
-    camoufox_cls, playwright_timeout_error = _ensure_camoufox()
+    _, playwright_timeout_error = _ensure_camoufox()
+    blocked_url_pattern = _blocked_url_pattern(block_resources) if block_resources else None
 
-    def task() -> tuple[str, str, Any | None]:
-        try:
-            with camoufox_cls(
-                geoip=True,
-                config={"humanize": True, "humanize:maxTime": 1.5, "humanize:minTime": 0.5},
-            ) as browser:
-                page = browser.new_page()
+    def task(context: Any) -> tuple[str, str, Any | None]:
+        page = context.new_page()
 
-                try:
-                    logger.info("Camoufox 导航: %s", url)
-                    response = page.goto(
-                        url,
-                        timeout=max(timeout, 1) * 1000,
-                        wait_until="domcontentloaded",
-                    )
-
-                    if response and response.status >= 400:
-                        status_text = getattr(response, "status_text", "") or ""
-                        raise FetchError(f"HTTP {response.status} {status_text}".strip())
-
-                    # 加载等待
-                    if playwright_timeout_error:
-                        with contextlib.suppress(playwright_timeout_error):
-                            page.wait_for_load_state("load", timeout=8000)
-                        with contextlib.suppress(playwright_timeout_error):
-                            page.wait_for_load_state("networkidle", timeout=8000)
-
-                    if wait_selector and playwright_timeout_error:
-                        with contextlib.suppress(playwright_timeout_error):
-                            page.wait_for_selector(wait_selector, timeout=15000)
-
-                    if post_process:
-                        post_process(page)
-
-                    if scroll:
-                        # 使用封装的滚动策略
-                        _auto_scroll(page, max_iterations=50)
-                        # 给懒加载内容一点额外的渲染时间
-                        page.wait_for_timeout(2000)
-
-                    data = extract(page) if extract else None
-                    html = page.content()
-                    final_url = page.url
-                    logger.info("Camoufox 抓取完成, 最终 URL: %s, HTML 长度: %d", final_url, len(html))
-
-                except FetchError:
-                    raise
-                except Exception as exc:  # pragma: no cover - 具体异常在上层处理
-                    raise FetchError(f"页面加载失败: {url}") from exc
-                finally:
-                    page.close()
+        try:
+            if blocked_url_pattern is not None:
+                # 正文抽取用不到的大体积资源直接中止请求，减少下载量与渲染耗时。
+                # 注意 Playwright 在页面启用路由后会关闭该页的 HTTP 缓存，这是拦截的代价
+                page.route(blocked_url_pattern, lambda route: route.abort())
+            logger.info("Camoufox 导航: %s", url)
+            response = page.goto(
+                url,
+                timeout=max(timeout, 1) * 1000,
+                wait_until="domcontentloaded",
+            )
+
+            if response and response.status >= 400:
+                status_text = getattr(response, "status_text", "") or ""
+                raise FetchError(f"HTTP {response.status} {status_text}".strip())
+
+            # 加载等待：goto 已等到 domcontentloaded，这里只短暂等待 load；
+            # 指定了 wait_selector 时以 selector 出现为准
+            if playwright_timeout_error:
+                with contextlib.suppress(playwright_timeout_error):
+                    page.wait_for_load_state("load", timeout=3000)
+                if wait_networkidle:
+                    with contextlib.suppress(playwright_timeout_error):
+                        page.wait_for_load_state("networkidle", timeout=8000)
+
+            if wait_selector and playwright_timeout_error:
+                with contextlib.suppress(playwright_timeout_error):
+                    page.wait_for_selector(wait_selector, timeout=15000)
+
+            if post_process:
+                post_process(page)
+
+            if scroll == "incremental":
+                # 逐屏滚动，适合需要持续触发加载的无限滚动页面
+                _auto_scroll(page)
+                # 给懒加载内容一点额外的渲染时间
+                page.wait_for_timeout(2000)
+            elif scroll:
+                _scroll_to_bottom(page, playwright_timeout_error, wait_networkidle=wait_networkidle)
+
+            data = extract(page) if extract else None
+            html = page.content()
+            final_url = page.url
+            logger.info("Camoufox 抓取完成, 最终 URL: %s, HTML 长度: %d", final_url, len(html))
 
         except FetchError:
             raise
-        except Exception as exc:  # pragma: no cover
-            raise FetchError(f"Headless 抓取失败: {url} ({_describe_runtime_error(exc)})") from exc
+        except Exception as exc:  # pragma: no cover - 具体异常在上层处理
+            raise FetchError(f"页面加载失败: {url}") from exc
+        finally:
+            page.close()
 
         return html, final_url, data
 
+    return task
+
+
+def fetch_with_camoufox(
+    url: str,
+    *,
+    timeout: int,
+    max_browsers: int,
+    wait_selector: str | None = None,
+    scroll: ScrollMode = True,
+    wait_networkidle: bool = False,
+    block_resources: frozenset[str] | None = DEFAULT_BLOCKED_RESOURCES,
+    post_process: Callable[[Any], None] | None = None,
+    extract: Callable[[Any], Any] | None = None,
+) -> tuple[str, str, Any | None]:
+    """在常驻 Camoufox 浏览器中抓取页面并返回 HTML/最终 URL/自定义数据。
+
+    Args:
+        url: 目标 URL
+        timeout: 超时时间（秒）
+        max_browsers: 浏览器池大小（对应 ``http.browser_workers``）
+        wait_selector: 可选，等待指定 selector 出现
+        scroll: 滚动方式：True 跳到底部并强制加载懒加载资源，"incremental" 逐屏滚动，False 不滚动
+        wait_networkidle: 是否额外等待网络空闲
+        block_resources: 拦截的子资源类型，None 表示不拦截
+        post_process: 可选，对页面执行额外处理（如移除弹窗）
+        extract: 可选，从页面提取结构化数据
+    """
+
+    task = build_page_task(
+        url,
+        timeout=timeout,
+        wait_selector=wait_selector,
+        scroll=scroll,
+        wait_networkidle=wait_networkidle,
+        block_resources=block_resources,
+        post_process=post_process,
+        extract=extract,
+    )
+
     try:
-        loop = asyncio.get_running_loop()
-        if loop.is_running():
-            return _run_in_fresh_thread(task)
-    except RuntimeError:
-        pass
+        return _get_browser_pool(max_browsers).run(task)
+    except FetchError:
+        raise
+    except Exception as exc:  # pragma: no cover
+        raise FetchError(f"Headless 抓取失败: {url} ({_describe_runtime_error(exc)})") from exc
+
+
+# Cookie 同意按钮的关键词（完全匹配，或关键词加简单标点）
+_CONSENT_KEYWORDS = [
+    "accept", "accept all", "accept cookies", "agree", "i agree", "allow", "allow all", "consent",
+    "接受", "同意", "允许", "全部接受", "此时接受", "知道了", "ok", "got it",
+]  # fmt: skip
+
+# 常见干扰元素选择器
+_OVERLAY_SELECTORS = [
+    "#onetrust-banner-sdk",  # OneTrust Cookie Banner
+    ".fc-consent-root",  # Funding Choices
+    "#cookie-banner",
+    ".cookie-banner",
+    "#cookies-banner",
+    ".cookies-banner",
+    "[id*='cookie-consent']",
+    "[class*='cookie-consent']",
+    "[id*='cookie-notice']",
+    "[class*='cookie-notice']",
+    ".cc-banner",  # Cookie Consent
+    ".cc-window",
+    ".adsbygoogle",  # Google Ads
+    ".ad-container",
+    "div[class*='popup'][style*='fixed']",  # 简单的通用弹窗匹配
+    "div[class*='modal'][style*='fixed']",
+]
+
+# 点击同意按钮与移除遮挡元素合并在一次 evaluate 中完成，页面内等待代替额外的往返
+_REMOVE_OVERLAYS_JS = compact_js(
+    """
+async ({ keywords, selectors, clickDelay }) => {
+    // 1. 尝试点击 "接受/同意" 按钮
+    const candidates = document.querySelectorAll('button, a, div[role="button"], input[type="button"], input[type="submit"], div[class*="button"], span[class*="button"]');
+    for (const el of candidates) {
+        // 忽略不可见元素
+        if (el.offsetParent === null) continue;
+        const text = (el.innerText || el.textContent || "").trim().toLowerCase();
+        // 优先完全匹配，或者是关键词加上简单的符号
+        if (keywords.some(k => text === k || text === k + "!" || text === k + ".")) {
+            el.click();
+            // 点击后等待一小段时间，让页面响应（如设置 cookie 并移除遮罩）
+            await new Promise(resolve => setTimeout(resolve, clickDelay));
+            break; // 点击一个后通常弹窗即消失，无需点击多个
+        }
+    }
 
-    return task()
+    // 2. 移除常见干扰元素
+    const removeSmall = (elements) => elements.forEach(el => {
+        // 简单的安全检查：避免删除过大的区域（可能是正文）
+        if (el.innerText.length < 2000) {
+            el.remove();
+        }
+    });
+    try {
+        // 合并为一个选择器，只遍历一次 DOM
+        removeSmall(document.querySelectorAll(selectors.join(",")));
+    } catch (e) {
+        // 合并后的选择器不被支持时，逐个执行并忽略单个选择器的错误
+        selectors.forEach(selector => {
+            try {
+                removeSmall(document.querySelectorAll(selector));
+            } catch (e) {}
+        });
+    }
+}
+"""  # noqa: E501
+)
 
 
 def remove_overlays(page: Any) -> None:
@@ -259,76 +601,10 @@ def remove_overlays(page: Any) -> None:
     """
     logger.info("尝试移除页面悬浮窗和干扰元素")
 
-    # 1. 尝试点击 "接受/同意" 按钮
-    try:
-        page.evaluate(
-            """() => {
-                const keywords = [
-                    "accept", "accept all", "accept cookies", "agree", "i agree", "allow", "allow all", "consent",
-                    "接受", "同意", "允许", "全部接受", "此时接受", "知道了", "ok", "got it"
-                ];
-
-                // 查找可能的按钮元素
-                const candidates = Array.from(document.querySelectorAll('button, a, div[role="button"], input[type="button"], input[type="submit"], div[class*="button"], span[class*="button"]'));
-                for (const el of candidates) {
-                    // 忽略不可见元素
-                    if (el.offsetParent === null) continue;
-                    const text = (el.innerText || el.textContent || "").trim().toLowerCase();
-                    // 检查文本是否匹配关键词
-                    // 优先完全匹配，或者是关键词加上简单的符号
-                    if (keywords.some(k => text === k || text === k + "!" || text === k + ".")) {
-                        console.log("Found connect button:", text);
-                        el.click();
-                        return; // 点击一个后通常页面会刷新或弹窗消失，不仅需点击多个
-                    }
-                }
-            }"""  # noqa: E501
-        )
-        # 点击后等待一小段时间，让页面响应（如设置 cookie 并移除遮罩）
-        page.wait_for_timeout(1000)
-    except Exception as e:
-        logger.warning("尝试点击 Cookie 接受按钮时出错 (忽略): %s", e)
-
-    # 2. 移除常见干扰元素选择器
-    selectors = [
-        "#onetrust-banner-sdk",  # OneTrust Cookie Banner
-        ".fc-consent-root",  # Funding Choices
-        "#cookie-banner",
-        ".cookie-banner",
-        "#cookies-banner",
-        ".cookies-banner",
-        "[id*='cookie-consent']",
-        "[class*='cookie-consent']",
-        "[id*='cookie-notice']",
-        "[class*='cookie-notice']",
-        ".cc-banner",  # Cookie Consent
-        ".cc-window",
-        ".adsbygoogle",  # Google Ads
-        ".ad-container",
-        "div[class*='popup'][style*='fixed']",  # 简单的通用弹窗匹配
-        "div[class*='modal'][style*='fixed']",
-    ]
-
     try:
-        # 注入 JS 移除元素
         page.evaluate(
-            """(selectors) => {
-                selectors.forEach(selector => {
-                    try {
-                        const elements = document.querySelectorAll(selector);
-                        elements.forEach(el => {
-                            // 简单的安全检查：避免删除过大的区域（可能是正文）
-                            // 这里只是简单判断，如果需要更安全可以检查文本量
-                            if (el.innerText.length < 2000) {
-                                el.remove();
-                            }
-                        });
-                    } catch (e) {
-                        // 忽略单个选择器的错误
-                    }
-                });
-            }""",
-            selectors,
+            _REMOVE_OVERLAYS_JS,
+            {"keywords": _CONSENT_KEYWORDS, "selectors": _OVERLAY_SELECTORS, "clickDelay": 500},
         )
         logger.info("悬浮窗移除脚本执行完毕")
     except Exception as e:
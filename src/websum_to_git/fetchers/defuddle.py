@@ -24,6 +24,8 @@ logger = logging.getLogger(__name__)
 
 DEFUDDLE_ENDPOINT = "https://defuddle.md/"
 _FRONT_MATTER_RE = re.compile(r"^---\s*\n(.*?)\n---\s*\n?", re.DOTALL)
+# 共享 Session：到 Defuddle 服务的 TCP/TLS 连接在多次兜底抓取间保持 keep-alive
+_session = requests.Session()
 
 
 def _build_proxy_url(url: str, config: AppConfig) -> str:
@@ -86,7 +88,7 @@ def fetch_defuddle(url: str, config: AppConfig) -> PageContent:
 
     logger.info("正在使用 Defuddle 抓取: %s", proxy_url)
     try:
-        response = requests.get(
+        response = _session.get(
             proxy_url,
             timeout=timeout,
             verify=verify_ssl,
@@ -97,7 +99,14 @@ def fetch_defuddle(url: str, config: AppConfig) -> PageContent:
         logger.warning("Defuddle 请求异常: %s", exc)
         raise FetchError(f"Defuddle Error: {exc}") from exc
 
-    raw_markdown = response.text or ""
+    # Defuddle 输出 UTF-8 Markdown；响应未声明 charset 时直接按 UTF-8 解码，
+    # 避免 requests 对 text/* 回退为 ISO-8859-1，或对整个响应逐字节猜测编码；
+    # 声明了 Python 不认识的 charset 时同样回退 UTF-8
+    declared = "charset=" in response.headers.get("Content-Type", "").lower()
+    try:
+        raw_markdown = response.content.decode(response.encoding if declared else "utf-8", errors="replace")
+    except LookupError:
+        raw_markdown = response.content.decode("utf-8", errors="replace")
     if not raw_markdown.strip():
         raise FetchError("Defuddle 返回内容为空")
 
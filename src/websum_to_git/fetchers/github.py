@@ -11,24 +11,118 @@
 
 from __future__ import annotations
 
-import base64
 import logging
 import re
-from collections.abc import Callable
+import threading
+from collections.abc import Callable, Iterator
 from dataclasses import dataclass
-from re import Pattern
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
+from urllib.parse import quote
 
+from cachetools import LRUCache, TTLCache
 from github import Auth, Github
 from github.GithubException import GithubException
 
 from .structs import FetchError, PageContent, get_common_config
 
 if TYPE_CHECKING:
+    from github.Repository import Repository
+
     from websum_to_git.config import AppConfig
 
 logger = logging.getLogger(__name__)
 
+# 仓库对象短期缓存：(PAT, owner/repo) -> Repository，连续抓取同一仓库的文件/README 时省去重复的 /repos 请求
+_REPO_CACHE_MAXSIZE = 128
+_REPO_CACHE_TTL_SECONDS = 300
+_repo_cache: TTLCache[tuple[str, str], Repository] = TTLCache(maxsize=_REPO_CACHE_MAXSIZE, ttl=_REPO_CACHE_TTL_SECONDS)
+_repo_cache_lock = threading.Lock()
+
+# raw 内容的条件请求缓存：(PAT, 接口路径, ref) -> (ETag, 响应头, 内容)。
+# 再次抓取时带 If-None-Match，未变更返回 304 直接复用缓存内容，且 304 不计入 GitHub 速率限制
+_RAW_CACHE_MAXSIZE = 256
+# 只缓存不超过该长度（字符数）的内容，避免少数大文件长期占用大量内存
+_RAW_CACHE_MAX_CONTENT_CHARS = 1_000_000
+_raw_cache: LRUCache[tuple[str, str, str], tuple[str, dict[str, Any], str]] = LRUCache(maxsize=_RAW_CACHE_MAXSIZE)
+_raw_cache_lock = threading.Lock()
+
+# Github 客户端按 (token, timeout, verify_ssl) 复用：每个客户端持有自己的 requests Session，
+# 复用后到 api.github.com 的 TCP/TLS 连接可保持 keep-alive；不同请求并发使用同一客户端是安全的
+_clients: dict[tuple[str, int, bool], Github] = {}
+_clients_lock = threading.Lock()
+
+# 路由表: 路由名 -> 正则；分组名带路由前缀，因为同一个正则里不能出现重名分组
+_ROUTE_PATTERNS = {
+    "gist": r"https?://gist\.github\.com/(?:[^/]+/)?(?P<gist_id>[a-f0-9]+)",
+    "file": r"https?://github\.com/(?P<file_owner>[^/]+)/(?P<file_repo>[^/]+)/blob/(?P<file_ref>[^/]+)/(?P<file_path>.+)",
+    "issue": (
+        r"https?://github\.com/(?P<issue_owner>[^/]+)/(?P<issue_repo>[^/]+)"
+        r"/(?P<issue_type>issues|pull)/(?P<issue_number>\d+)"
+    ),
+    "repo": r"https?://github\.com/(?P<repo_owner>[^/]+)/(?P<repo_name>[^/]+)(?:/tree/.*)?",
+}
+# 合并为一个交替正则，按表中顺序尝试；外层命名分组最后闭合，match.lastgroup 即命中的路由名
+_ROUTE_RE = re.compile("^(?:" + "|".join(f"(?P<{name}>{pattern}$)" for name, pattern in _ROUTE_PATTERNS.items()) + ")")
+
+# Issue/PR 详情与前 10 条评论一次 GraphQL 查询取回，替代 REST 的 get_repo/get_issue/get_comments 多次往返
+_ISSUE_FIELDS = (
+    "title body state createdAt author { login } "
+    "labels(first: 20) { nodes { name } } comments(first: 10) { nodes { author { login } body } }"
+)
+_ISSUE_OR_PR_QUERY = f"""
+query($owner: String!, $name: String!, $number: Int!) {{
+  repository(owner: $owner, name: $name) {{
+    issueOrPullRequest(number: $number) {{
+      __typename
+      ... on Issue {{ {_ISSUE_FIELDS} }}
+      ... on PullRequest {{ {_ISSUE_FIELDS} }}
+    }}
+  }}
+}}
+"""
+
+# 文件扩展名 -> 代码块语言
+_LANG_MAP: dict[str, str] = {
+    "py": "python",
+    "js": "javascript",
+    "ts": "typescript",
+    "go": "go",
+    "rs": "rust",
+    "java": "java",
+    "rb": "ruby",
+    "cpp": "cpp",
+    "c": "c",
+    "h": "c",
+    "md": "markdown",
+    "json": "json",
+    "yaml": "yaml",
+    "yml": "yaml",
+    "toml": "toml",
+    "sh": "bash",
+}
+
+# 固定结构页面的 Markdown 模板，一次 format_map 渲染；Issue/PR 与 Gist 段落数可变，仍逐行生成
+_REPO_TEMPLATE = (
+    "# {repo_name}\n\n"
+    "{desc_block}"
+    "**语言**: {language} | **Stars**: {stars} | **Forks**: {forks}\n\n"
+    "[查看仓库]({url})\n\n"
+    "---\n\n"
+    "## README\n\n"
+    "{readme}"
+)
+_FILE_TEMPLATE = (
+    "# {filename}\n\n"
+    "**仓库**: [{owner}/{repo}](https://github.com/{owner}/{repo})\n"
+    "**路径**: `{file_path}`\n"
+    "**分支/标签**: `{ref}`\n\n"
+    "[查看原文件]({url})\n\n"
+    "---\n\n"
+    "```{language}\n"
+    "{content}\n"
+    "```"
+)
+
 
 @dataclass
 class GitHubFetcher:
@@ -38,41 +132,23 @@ class GitHubFetcher:
 
     def __post_init__(self):
         timeout, verify_ssl = get_common_config(self.config)
-        token = self.config.github.pat
-
-        auth = Auth.Token(token) if token else None
-        self._github = Github(auth=auth, timeout=timeout, verify=verify_ssl)
-
-        # 路由表: (正则, 处理函数)
-        self._routes: list[tuple[Pattern, Callable[[str, re.Match], PageContent]]] = [
-            (
-                re.compile(r"^https?://gist\.github\.com/(?:[^/]+/)?(?P<gist_id>[a-f0-9]+)$"),
-                self._handle_gist,
-            ),
-            (
-                re.compile(r"^https?://github\.com/(?P<owner>[^/]+)/(?P<repo>[^/]+)/blob/(?P<ref>[^/]+)/(?P<path>.+)$"),
-                self._handle_file,
-            ),
-            (
-                re.compile(
-                    r"^https?://github\.com/(?P<owner>[^/]+)/(?P<repo>[^/]+)/(?P<type>issues|pull)/(?P<number>\d+)$"
-                ),
-                self._handle_issue_or_pr,
-            ),
-            (
-                re.compile(r"^https?://github\.com/(?P<owner>[^/]+)/(?P<repo>[^/]+)(?:/tree/.*)?$"),
-                self._handle_repo,
-            ),
-        ]
+        self._github = _get_client(self.config.github.pat, timeout, verify_ssl)
+
+        # 路由名 -> 处理函数
+        self._dispatch: dict[str, Callable[[str, re.Match], PageContent]] = {
+            "gist": self._handle_gist,
+            "file": self._handle_file,
+            "issue": self._handle_issue_or_pr,
+            "repo": self._handle_repo,
+        }
 
     def fetch(self, url: str) -> PageContent:
         """抓取 GitHub 内容。"""
         logger.info("使用 GitHubFetcher 抓取: %s", url)
 
-        for pattern, handler in self._routes:
-            match = pattern.match(url)
-            if match:
-                return handler(url, match)
+        match = _ROUTE_RE.match(url)
+        if match and match.lastgroup:
+            return self._dispatch[match.lastgroup](url, match)
 
         raise FetchError(f"不支持的 GitHub URL 格式: {url}")
 
@@ -85,32 +161,73 @@ class GitHubFetcher:
         """处理代码文件 URL。"""
         return self._fetch_file(
             url,
-            match.group("owner"),
-            match.group("repo"),
-            match.group("ref"),
-            match.group("path"),
+            match.group("file_owner"),
+            match.group("file_repo"),
+            match.group("file_ref"),
+            match.group("file_path"),
         )
 
     def _handle_issue_or_pr(self, url: str, match: re.Match) -> PageContent:
         """处理 Issue/PR URL。"""
         return self._fetch_issue_or_pr(
             url,
-            match.group("owner"),
-            match.group("repo"),
-            int(match.group("number")),
-            is_pr=(match.group("type") == "pull"),
+            match.group("issue_owner"),
+            match.group("issue_repo"),
+            int(match.group("issue_number")),
+            is_pr=(match.group("issue_type") == "pull"),
         )
 
     def _handle_repo(self, url: str, match: re.Match) -> PageContent:
         """处理仓库主页 URL。"""
-        return self._fetch_repo_readme(url, match.group("owner"), match.group("repo"))
+        return self._fetch_repo_readme(url, match.group("repo_owner"), match.group("repo_name"))
+
+    def _get_repo(self, owner: str, repo: str) -> Repository:
+        """获取仓库对象，TTL 内复用缓存。"""
+        key = (self.config.github.pat, f"{owner}/{repo}")
+        with _repo_cache_lock:
+            cached = _repo_cache.get(key)
+        if cached is not None:
+            return cached
+
+        gh_repo = self._github.get_repo(key[1])
+        with _repo_cache_lock:
+            _repo_cache[key] = gh_repo
+        return gh_repo
+
+    def _get_raw(self, path: str, ref: str | None = None) -> tuple[int, dict[str, Any], str]:
+        """以 raw 媒体类型 GET 内容接口，带 ETag 条件请求；返回 (状态码, 响应头, 内容)。"""
+        key = (self.config.github.pat, path, ref or "")
+        with _raw_cache_lock:
+            cached = _raw_cache.get(key)
+
+        headers = {"Accept": "application/vnd.github.raw"}
+        if cached is not None:
+            headers["If-None-Match"] = cached[0]
+        status, resp_headers, content = self._github.requester.requestJson(
+            "GET",
+            path,
+            parameters={"ref": ref} if ref else None,
+            headers=headers,
+        )
+
+        if status == 304 and cached is not None:
+            logger.info("GitHub 内容未变更，复用缓存: %s", path)
+            return 200, cached[1], cached[2]
+        etag = resp_headers.get("etag")
+        if status == 200:
+            with _raw_cache_lock:
+                if etag and len(content) <= _RAW_CACHE_MAX_CONTENT_CHARS:
+                    _raw_cache[key] = (etag, resp_headers, content)
+                else:
+                    _raw_cache.pop(key, None)
+        return status, resp_headers, content
 
     def _fetch_repo_readme(self, url: str, owner: str, repo: str) -> PageContent:
         """获取仓库 README。"""
         logger.info("获取仓库 README: %s/%s", owner, repo)
 
         try:
-            gh_repo = self._github.get_repo(f"{owner}/{repo}")
+            gh_repo = self._get_repo(owner, repo)
         except GithubException as exc:
             raise FetchError(f"无法获取仓库 {owner}/{repo}: {exc}") from exc
 
@@ -120,33 +237,26 @@ class GitHubFetcher:
         forks = gh_repo.forks_count
         language = gh_repo.language or ""
 
-        # 获取 README
+        # 获取 README：raw 原文免 base64 解码，未变更时命中条件请求缓存
         try:
-            readme = gh_repo.get_readme()
-            readme_content = base64.b64decode(readme.content).decode("utf-8")
+            status, _, readme_content = self._get_raw(f"/repos/{owner}/{repo}/readme")
         except GithubException:
+            status = 404
+        if status >= 400:
             readme_content = "(无 README)"
 
         # 构建 Markdown
-        markdown_parts = []
-        markdown_parts.append(f"# {repo_name}")
-        markdown_parts.append("")
-
-        if description:
-            markdown_parts.append(f"> {description}")
-            markdown_parts.append("")
-
-        markdown_parts.append(f"**语言**: {language or '未知'} | **Stars**: {stars} | **Forks**: {forks}")
-        markdown_parts.append("")
-        markdown_parts.append(f"[查看仓库]({url})")
-        markdown_parts.append("")
-        markdown_parts.append("---")
-        markdown_parts.append("")
-        markdown_parts.append("## README")
-        markdown_parts.append("")
-        markdown_parts.append(readme_content)
-
-        markdown = "\n".join(markdown_parts)
+        markdown = _REPO_TEMPLATE.format_map(
+            {
+                "repo_name": repo_name,
+                "desc_block": f"> {description}\n\n" if description else "",
+                "language": language or "未知",
+                "stars": stars,
+                "forks": forks,
+                "url": url,
+                "readme": readme_content,
+            }
+        )
         title = f"{repo_name} - GitHub 仓库"
 
         return PageContent(
@@ -165,64 +275,63 @@ class GitHubFetcher:
         logger.info("获取 %s: %s/%s#%s", item_type, owner, repo, number)
 
         try:
-            gh_repo = self._github.get_repo(f"{owner}/{repo}")
-            item = gh_repo.get_pull(number) if is_pr else gh_repo.get_issue(number)
+            _, data = self._github.requester.graphql_query(
+                _ISSUE_OR_PR_QUERY, {"owner": owner, "name": repo, "number": number}
+            )
         except GithubException as exc:
             raise FetchError(f"无法获取 {item_type} {owner}/{repo}#{number}: {exc}") from exc
 
-        title = item.title or ""
-        body = item.body or ""
-        state = item.state
-        user = item.user.login if item.user else "unknown"
-        created_at = item.created_at.isoformat() if item.created_at else ""
-        labels = [label.name for label in item.labels]
-
-        # 获取评论（Issue API 可获取评论，PR 需要通过 issue 获取评论）
-        comments: list[dict[str, str]] = []
-        try:
-            # PR 的评论需要通过 issue 接口获取
-            issue = gh_repo.get_issue(number)
-            for i, comment in enumerate(issue.get_comments()):
-                if i >= 10:  # 最多 10 条评论
-                    break
-                comment_user = comment.user.login if comment.user else "unknown"
-                comment_body = comment.body or ""
-                comments.append({"user": comment_user, "body": comment_body})
-        except GithubException:
-            pass
+        item = ((data.get("data") or {}).get("repository") or {}).get("issueOrPullRequest")
+        if not item:
+            raise FetchError(f"无法获取 {item_type} {owner}/{repo}#{number}: 不存在")
+
+        # 以 API 返回的实际类型为准（/issues/ 链接也可能指向 PR）
+        item_type = "PR" if item.get("__typename") == "PullRequest" else "Issue"
+        title = item.get("title") or ""
+        body = item.get("body") or ""
+        state = (item.get("state") or "").lower()
+        user = (item.get("author") or {}).get("login") or "unknown"
+        created_at = item.get("createdAt") or ""
+        labels = [label["name"] for label in (item.get("labels") or {}).get("nodes") or []]
+
+        # 评论（最多 10 条）
+        comments: list[dict[str, str]] = [
+            {
+                "user": (comment.get("author") or {}).get("login") or "unknown",
+                "body": comment.get("body") or "",
+            }
+            for comment in (item.get("comments") or {}).get("nodes") or []
+        ]
 
         # 构建 Markdown
-        markdown_parts = []
-        markdown_parts.append(f"# {title}")
-        markdown_parts.append("")
-        repo_url = url.split("/issues/")[0].split("/pull/")[0]
-        markdown_parts.append(f"**{item_type}** #{number} in [{owner}/{repo}]({repo_url})")
-        markdown_parts.append("")
-        markdown_parts.append(f"**状态**: {state} | **作者**: @{user} | **创建时间**: {created_at}")
-
-        if labels:
-            markdown_parts.append(f"**标签**: {', '.join(labels)}")
-
-        markdown_parts.append("")
-        markdown_parts.append("---")
-        markdown_parts.append("")
-        markdown_parts.append(body)
-
-        if comments:
-            markdown_parts.append("")
-            markdown_parts.append("---")
-            markdown_parts.append("")
-            markdown_parts.append("## 评论")
-            for _i, comment in enumerate(comments, 1):
-                markdown_parts.append("")
-                markdown_parts.append(f"### @{comment['user']}")
-                markdown_parts.append("")
-                markdown_parts.append(comment["body"])
-
-        markdown_parts.append("")
-        markdown_parts.append(f"[查看原文]({url})")
-
-        markdown = "\n".join(markdown_parts)
+        repo_url = f"https://github.com/{owner}/{repo}"
+
+        def _emit() -> Iterator[str]:
+            yield f"# {title}"
+            yield ""
+            yield f"**{item_type}** #{number} in [{owner}/{repo}]({repo_url})"
+            yield ""
+            yield f"**状态**: {state} | **作者**: @{user} | **创建时间**: {created_at}"
+            if labels:
+                yield f"**标签**: {', '.join(labels)}"
+            yield ""
+            yield "---"
+            yield ""
+            yield body
+            if comments:
+                yield ""
+                yield "---"
+                yield ""
+                yield "## 评论"
+                for comment in comments:
+                    yield ""
+                    yield f"### @{comment['user']}"
+                    yield ""
+                    yield comment["body"]
+            yield ""
+            yield f"[查看原文]({url})"
+
+        markdown = "\n".join(_emit())
         full_title = f"{title} · {item_type} #{number} · {owner}/{repo}"
 
         return PageContent(
@@ -239,58 +348,38 @@ class GitHubFetcher:
         """获取代码文件内容。"""
         logger.info("获取代码文件: %s/%s/%s@%s", owner, repo, file_path, ref)
 
+        # 以 raw 媒体类型直接取文件原文：无需 base64 解码，也不受 JSON 接口 1MB 内容上限限制；
+        # 复用共享客户端的连接与认证
         try:
-            gh_repo = self._github.get_repo(f"{owner}/{repo}")
-            file_content = gh_repo.get_contents(file_path, ref=ref)
+            status, headers, content = self._get_raw(f"/repos/{owner}/{repo}/contents/{quote(file_path)}", ref)
         except GithubException as exc:
             raise FetchError(f"无法获取文件 {owner}/{repo}/{file_path}: {exc}") from exc
 
-        # get_contents 可能返回列表（目录）或单个文件
-        if isinstance(file_content, list):
+        if status >= 400:
+            raise FetchError(f"无法获取文件 {owner}/{repo}/{file_path}: HTTP {status}")
+        # 目录不支持 raw 媒体类型，接口仍返回 JSON 列表
+        if headers.get("content-type", "").startswith("application/json") and content.lstrip().startswith("["):
             raise FetchError(f"路径 {file_path} 是目录，不是文件")
 
-        content = base64.b64decode(file_content.content).decode("utf-8")
         filename = file_path.split("/")[-1]
 
         # 检测语言
-        ext = filename.split(".")[-1] if "." in filename else ""
-        lang_map = {
-            "py": "python",
-            "js": "javascript",
-            "ts": "typescript",
-            "go": "go",
-            "rs": "rust",
-            "java": "java",
-            "rb": "ruby",
-            "cpp": "cpp",
-            "c": "c",
-            "h": "c",
-            "md": "markdown",
-            "json": "json",
-            "yaml": "yaml",
-            "yml": "yaml",
-            "toml": "toml",
-            "sh": "bash",
-        }
-        language = lang_map.get(ext, "")
+        _, dot, ext = filename.rpartition(".")
+        language = _LANG_MAP.get(ext.lower(), "") if dot else ""
 
         # 构建 Markdown
-        markdown_parts = []
-        markdown_parts.append(f"# {filename}")
-        markdown_parts.append("")
-        markdown_parts.append(f"**仓库**: [{owner}/{repo}]({url.split('/blob/')[0]})")
-        markdown_parts.append(f"**路径**: `{file_path}`")
-        markdown_parts.append(f"**分支/标签**: `{ref}`")
-        markdown_parts.append("")
-        markdown_parts.append(f"[查看原文件]({url})")
-        markdown_parts.append("")
-        markdown_parts.append("---")
-        markdown_parts.append("")
-        markdown_parts.append(f"```{language}")
-        markdown_parts.append(content)
-        markdown_parts.append("```")
-
-        markdown = "\n".join(markdown_parts)
+        markdown = _FILE_TEMPLATE.format_map(
+            {
+                "filename": filename,
+                "owner": owner,
+                "repo": repo,
+                "file_path": file_path,
+                "ref": ref,
+                "url": url,
+                "language": language,
+                "content": content,
+            }
+        )
         title = f"{filename} · {owner}/{repo}"
 
         return PageContent(
@@ -317,45 +406,48 @@ class GitHubFetcher:
         files = gist.files
 
         # 构建 Markdown
-        markdown_parts = []
-        markdown_parts.append(f"# Gist by @{owner_login}")
-        markdown_parts.append("")
-
-        if description:
-            markdown_parts.append(f"> {description}")
-            markdown_parts.append("")
-
-        markdown_parts.append(f"[查看 Gist]({url})")
-        markdown_parts.append("")
-        markdown_parts.append("---")
-
-        all_content = []
-        for filename, file_data in files.items():
-            content = file_data.content or ""
-            language = (file_data.language or "").lower()
-            all_content.append(content)
-
-            markdown_parts.append("")
-            markdown_parts.append(f"## {filename}")
-            markdown_parts.append("")
-            markdown_parts.append(f"```{language}")
-            markdown_parts.append(content)
-            markdown_parts.append("```")
-
-        markdown = "\n".join(markdown_parts)
+        def _emit() -> Iterator[str]:
+            yield f"# Gist by @{owner_login}"
+            yield ""
+            if description:
+                yield f"> {description}"
+                yield ""
+            yield f"[查看 Gist]({url})"
+            yield ""
+            yield "---"
+            for filename, file_data in files.items():
+                yield ""
+                yield f"## {filename}"
+                yield ""
+                yield f"```{(file_data.language or '').lower()}"
+                yield file_data.content or ""
+                yield "```"
+
+        markdown = "\n".join(_emit())
         title = f"Gist: {description or gist_id}"
 
         return PageContent(
             url=url,
             final_url=url,
             title=title,
-            text="\n\n".join(all_content),
+            text="\n\n".join(file_data.content or "" for file_data in files.values()),
             markdown=markdown,
             raw_html=f"<article><h1>{title}</h1><p>{description}</p></article>",
             article_html=f"<article>{description}</article>",
         )
 
 
+def _get_client(token: str, timeout: int, verify_ssl: bool) -> Github:
+    """获取（或创建）与参数对应的共享 Github 客户端。"""
+    key = (token, timeout, verify_ssl)
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            auth = Auth.Token(token) if token else None
+            client = _clients[key] = Github(auth=auth, timeout=timeout, verify=verify_ssl)
+        return client
+
+
 def fetch_github(url: str, config: AppConfig) -> PageContent:
     """GitHub Fetcher 入口函数。"""
     fetcher = GitHubFetcher(config)
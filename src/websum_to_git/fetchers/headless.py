@@ -11,8 +11,8 @@ from typing import TYPE_CHECKING
 
 from .camoufox_helper import fetch_with_camoufox, remove_overlays
 from .headless_strategies.registry import get_route
-from .html_utils import extract_article
-from .structs import PageContent, get_common_config
+from .html_utils import extract_article_bounded
+from .structs import DEFAULT_BLOCKED_RESOURCES, PageContent, get_common_config
 
 if TYPE_CHECKING:
     from websum_to_git.config import AppConfig
@@ -30,6 +30,8 @@ def fetch_headless(url: str, config: AppConfig) -> PageContent:
     base_timeout, _ = get_common_config(config)
     timeout = base_timeout
     scroll = True
+    wait_networkidle = False
+    block_resources: frozenset[str] | None = DEFAULT_BLOCKED_RESOURCES
     wait_selector = None
     post_process = remove_overlays  # 默认通用处理
     extract = None
@@ -42,6 +44,8 @@ def fetch_headless(url: str, config: AppConfig) -> PageContent:
         if cfg.wait_selector:
             wait_selector = cfg.wait_selector
         scroll = cfg.scroll
+        wait_networkidle = cfg.wait_networkidle
+        block_resources = cfg.block_resources
 
         # 如果策略定义了处理函数，则覆盖默认的 post_process
         if route.process_page:
@@ -55,8 +59,11 @@ def fetch_headless(url: str, config: AppConfig) -> PageContent:
     html, final_url, data = fetch_with_camoufox(
         url,
         timeout=timeout,
+        max_browsers=config.http.browser_workers,
         wait_selector=wait_selector,
         scroll=scroll,
+        wait_networkidle=wait_networkidle,
+        block_resources=block_resources,
         post_process=post_process,
         extract=extract,
     )
@@ -66,8 +73,8 @@ def fetch_headless(url: str, config: AppConfig) -> PageContent:
         logger.debug("使用策略自定义构建内容")
         return route.build_content(url, final_url, html, data)
 
-    # 默认构建流程 (Readability)
-    article_data = extract_article(html, final_url)
+    # 默认构建流程 (Readability)，CPU 密集部分交给有界解析池
+    article_data = extract_article_bounded(html, final_url, max_workers=config.http.parser_workers)
 
     return PageContent(
         url=url,
@@ -21,6 +21,11 @@ from .registry import route
 
 logger = logging.getLogger(__name__)
 
+# 一次 evaluate 取回 Space iframe 的 src：无 iframe 返回 null，无 src 返回空串
+_SPACE_IFRAME_SRC_JS = (
+    "() => { const f = document.querySelector('iframe.space-iframe'); return f ? f.getAttribute('src') || '' : null; }"
+)
+
 
 @route("huggingface.co", scroll=False)
 @route("hf.space", scroll=False)
@@ -33,12 +38,11 @@ def process_huggingface(page: Any) -> None:
     """
     # 尝试查找 Spaces iframe
     # 不使用 wait_for_selector，避免非 Spaces 页面超时
-    iframe = page.query_selector("iframe.space-iframe")
-    if not iframe:
+    src = page.evaluate(_SPACE_IFRAME_SRC_JS)
+    if src is None:
         logger.debug("当前 HuggingFace 页面未检测到 Space iframe，跳过重定向")
         return
 
-    src = iframe.get_attribute("src")
     if not src:
         logger.debug("检测到 iframe.space-iframe 但未找到 src 属性")
         return
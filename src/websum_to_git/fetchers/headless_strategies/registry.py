@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+import functools
 import logging
 from collections.abc import Callable
 from typing import Any, NamedTuple, cast
+from urllib.parse import urlsplit
 
-from websum_to_git.fetchers.structs import HeadlessConfig, PageContent
+from websum_to_git.fetchers.structs import DEFAULT_BLOCKED_RESOURCES, HeadlessConfig, PageContent, ScrollMode
 
 # 浏览器页面对象类型 (Playwright Page)
 Page = Any
@@ -23,15 +25,29 @@ class HeadlessRoute(NamedTuple):
     build_content: Callable[[str, str, str, Any], PageContent] | None = None
 
 
-# 全局路由表
-_ROUTES: list[HeadlessRoute] = []
+# 全局路由表：字符串 pattern 按域名索引，查找与已注册策略数量无关；函数 pattern 按注册顺序逐个匹配
+_HOST_ROUTES: dict[str, HeadlessRoute] = {}
+_CALLABLE_ROUTES: list[HeadlessRoute] = []
+
+
+@functools.lru_cache(maxsize=1024)
+def _host_of(url: str) -> str:
+    """解析 URL 的域名；同一 URL 的匹配与查表只解析一次。"""
+    return urlsplit(url).hostname or ""
+
+
+def _host_matches(host: str, pattern: str) -> bool:
+    """域名等于 pattern 或是其子域名。"""
+    return host == pattern or host.endswith("." + pattern)
 
 
 def route(
     pattern: str | Callable[[str], bool],
     timeout: int | None = None,
     wait_selector: str | None = None,
-    scroll: bool = True,
+    scroll: ScrollMode = True,
+    wait_networkidle: bool = False,
+    block_resources: frozenset[str] | None = DEFAULT_BLOCKED_RESOURCES,
 ):
     """注册 Headless 抓取策略的装饰器。
 
@@ -39,16 +55,28 @@ def route(
 
     Args:
         pattern: 域名字符串 (如 "twitter.com") 或 匹配函数。
-            - 当为字符串时，内部使用 ``pattern in url`` 做子串匹配；
+            - 当为字符串时，按 URL 的域名匹配，域名等于 pattern 或为其子域名即命中；
             - 当为函数时，应接受完整 URL 字符串并返回 bool，用于自定义匹配规则。
         timeout: 自定义超时
         wait_selector: 等待的选择器
-        scroll: 是否滚动
+        scroll: 滚动方式，True 跳到底部、"incremental" 逐屏滚动、False 不滚动
+        wait_networkidle: 是否额外等待网络空闲（默认只等 domcontentloaded 与短暂的 load）
+        block_resources: 拦截的子资源类型（默认图片/媒体/字体），None 表示不拦截
     """
 
     def decorator(obj):
-        matcher = (lambda u: pattern in u) if isinstance(pattern, str) else pattern
-        config = HeadlessConfig(timeout=timeout, wait_selector=wait_selector, scroll=scroll)
+        if isinstance(pattern, str):
+            host_pattern = pattern.lower()
+            matcher = lambda u: _host_matches(_host_of(u), host_pattern)  # noqa: E731
+        else:
+            matcher = pattern
+        config = HeadlessConfig(
+            timeout=timeout,
+            wait_selector=wait_selector,
+            scroll=scroll,
+            wait_networkidle=wait_networkidle,
+            block_resources=block_resources,
+        )
 
         process_page: Callable[[Page], None] | None = None
         extract = None
@@ -74,16 +102,36 @@ def route(
             extract=extract,
             build_content=build_content,
         )
-        _ROUTES.append(r)
+        if isinstance(pattern, str):
+            # 同一域名重复注册时保留先注册的策略，与原先按注册顺序匹配的优先级一致
+            _HOST_ROUTES.setdefault(host_pattern, r)
+        else:
+            _CALLABLE_ROUTES.append(r)
+        _lookup_host.cache_clear()
         logger.info("已注册 Headless 策略: %s (pattern=%s)", obj.__name__, pattern)
         return obj
 
     return decorator
 
 
+# 按域名缓存查找结果：同一站点的链接反复提交时直接命中；注册新策略时清空
+@functools.lru_cache(maxsize=512)
+def _lookup_host(host: str) -> HeadlessRoute | None:
+    """按域名及其各级父域名查找路由：a.b.com 依次尝试 a.b.com、b.com、com。"""
+    while host:
+        r = _HOST_ROUTES.get(host)
+        if r is not None:
+            return r
+        _, _, host = host.partition(".")
+    return None
+
+
 def get_route(url: str) -> HeadlessRoute | None:
-    """获取匹配当前 URL 的路由。"""
-    for route in _ROUTES:
-        if route.matcher(url):
-            return route
+    """获取匹配当前 URL 的路由：先按域名查表，未命中再逐个尝试函数匹配。"""
+    r = _lookup_host(_host_of(url))
+    if r is not None:
+        return r
+    for r in _CALLABLE_ROUTES:
+        if r.matcher(url):
+            return r
     return None
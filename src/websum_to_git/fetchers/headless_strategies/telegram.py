@@ -3,14 +3,95 @@
 from __future__ import annotations
 
 import logging
+import re
+from collections.abc import Iterator
 from typing import Any, cast
 
+from websum_to_git.fetchers.camoufox_helper import compact_js
 from websum_to_git.fetchers.structs import PageContent
 
 from .registry import route
 
 logger = logging.getLogger(__name__)
 
+# 消息正文 HTML 的简单清洗
+_TAG_RE = re.compile(r"<[^>]+>")
+_BR_RE = re.compile(r"<br\s*/?>")
+# Telegram embed iframe 的 URL 通常包含 embed=1 或是 /s/ 路径
+_EMBED_FRAME_RE = re.compile(r"[?&]embed=1|/s/")
+
+# 在单个 frame 中提取消息正文、链接预览、作者、时间与浏览量
+_EXTRACT_MESSAGE_JS = compact_js(
+    """
+() => {
+    const data = {
+        text: '',
+        author_name: '',
+        author_link: '',
+        datetime: '',
+        views: '',
+        link_preview: null,
+        found: false
+    };
+
+    // 提取消息正文
+    const textEl = document.querySelector('.tgme_widget_message_text');
+    if (textEl) {
+        data.text = textEl.innerHTML;
+        data.found = true;
+    }
+
+    // 提取链接预览卡片
+    const linkPreview = document.querySelector('.tgme_widget_message_link_preview');
+    if (linkPreview) {
+        const preview = {
+            url: linkPreview.getAttribute('href') || '',
+            site_name: '',
+            title: '',
+            description: ''
+        };
+
+        // 网站名称 (如 "X (formerly Twitter)")
+        const siteEl = linkPreview.querySelector('.link_preview_site_name');
+        if (siteEl) preview.site_name = siteEl.textContent || '';
+
+        // 标题
+        const titleEl = linkPreview.querySelector('.link_preview_title');
+        if (titleEl) preview.title = titleEl.textContent || '';
+
+        // 描述
+        const descEl = linkPreview.querySelector('.link_preview_description');
+        if (descEl) preview.description = descEl.textContent || '';
+
+        data.link_preview = preview;
+        data.found = true;
+    }
+
+    // 提取作者信息
+    const authorEl = document.querySelector('.tgme_widget_message_owner_name');
+    if (authorEl) {
+        data.author_name = authorEl.textContent || '';
+        const link = authorEl.querySelector('a');
+        if (link) data.author_link = link.getAttribute('href') || '';
+    }
+
+    // 提取时间
+    const timeEl = document.querySelector('.tgme_widget_message_date time');
+    if (timeEl) {
+        data.datetime = timeEl.getAttribute('datetime') || timeEl.textContent || '';
+    }
+
+    // 提取浏览量
+    const viewsEl = document.querySelector('.tgme_widget_message_views');
+    if (viewsEl) {
+        data.views = viewsEl.textContent || '';
+    }
+
+    return data;
+}
+"""
+)
+
 
 @route("t.me", scroll=False)
 class TelegramStrategy:
@@ -38,84 +119,14 @@ class TelegramStrategy:
         frames = page.frames
         logger.debug("页面共有 %d 个 frames", len(frames))
 
-        # 遍历所有 frame 查找消息内容
+        # embed iframe 排在最前，通常一次 evaluate 即命中；未命中再依次尝试其余 frame
+        frames = sorted(frames, key=lambda f: _EMBED_FRAME_RE.search(f.url) is None)
         for frame in frames:
             try:
                 frame_url = frame.url
                 logger.debug("检查 frame: %s", frame_url)
 
-                # Telegram embed iframe 的 URL 通常包含 embed=1 或是 /s/ 路径
-                # 直接尝试在每个 frame 中查找消息元素
-                result = frame.evaluate(
-                    """
-                    () => {
-                        const data = {
-                            text: '',
-                            author_name: '',
-                            author_link: '',
-                            datetime: '',
-                            views: '',
-                            link_preview: null,
-                            found: false
-                        };
-
-                        // 提取消息正文
-                        const textEl = document.querySelector('.tgme_widget_message_text');
-                        if (textEl) {
-                            data.text = textEl.innerHTML;
-                            data.found = true;
-                        }
-
-                        // 提取链接预览卡片
-                        const linkPreview = document.querySelector('.tgme_widget_message_link_preview');
-                        if (linkPreview) {
-                            const preview = {
-                                url: linkPreview.getAttribute('href') || '',
-                                site_name: '',
-                                title: '',
-                                description: ''
-                            };
-
-                            // 网站名称 (如 "X (formerly Twitter)")
-                            const siteEl = linkPreview.querySelector('.link_preview_site_name');
-                            if (siteEl) preview.site_name = siteEl.textContent || '';
-
-                            // 标题
-                            const titleEl = linkPreview.querySelector('.link_preview_title');
-                            if (titleEl) preview.title = titleEl.textContent || '';
-
-                            // 描述
-                            const descEl = linkPreview.querySelector('.link_preview_description');
-                            if (descEl) preview.description = descEl.textContent || '';
-
-                            data.link_preview = preview;
-                            data.found = true;
-                        }
-
-                        // 提取作者信息
-                        const authorEl = document.querySelector('.tgme_widget_message_owner_name');
-                        if (authorEl) {
-                            data.author_name = authorEl.textContent || '';
-                            const link = authorEl.querySelector('a');
-                            if (link) data.author_link = link.getAttribute('href') || '';
-                        }
-
-                        // 提取时间
-                        const timeEl = document.querySelector('.tgme_widget_message_date time');
-                        if (timeEl) {
-                            data.datetime = timeEl.getAttribute('datetime') || timeEl.textContent || '';
-                        }
-
-                        // 提取浏览量
-                        const viewsEl = document.querySelector('.tgme_widget_message_views');
-                        if (viewsEl) {
-                            data.views = viewsEl.textContent || '';
-                        }
-
-                        return data;
-                    }
-                    """
-                )
+                result = frame.evaluate(_EXTRACT_MESSAGE_JS)
 
                 if result.get("found"):
                     logger.info("在 frame [%s] 中找到 Telegram 消息内容", frame_url)
@@ -139,8 +150,6 @@ class TelegramStrategy:
     @staticmethod
     def build(url: str, final_url: str, html: str, data: Any) -> PageContent:
         """构建 PageContent。"""
-        import re
-
         msg_data = cast(dict[str, Any], data or {})
 
         text = msg_data.get("text", "")
@@ -150,66 +159,57 @@ class TelegramStrategy:
         views = msg_data.get("views", "")
         link_preview = msg_data.get("link_preview")
 
-        # 标题：截取前50字符
-        text_preview = text[:50] + "..." if len(text) > 50 else text
-        # 移除 HTML 标签用于标题
-        text_plain = re.sub(r"<[^>]+>", "", text_preview)
+        # 移除 HTML 标签只做一次，标题与纯文本共用；标题截取前50字符
+        stripped = _TAG_RE.sub("", text) if text else ""
+        text_plain = stripped[:50] + "..." if len(stripped) > 50 else stripped
         title = f"{author_name}: {text_plain}" if author_name else text_plain
 
-        markdown_parts = []
-
-        # 消息正文（保留原始 HTML 转换为 Markdown）
-        if text:
-            # 简单处理：将 <br> 转换为换行
-            text_md = text.replace("<br>", "\n").replace("<br/>", "\n").replace("<br />", "\n")
-            text_md = re.sub(r"<[^>]+>", "", text_md)  # 移除其他 HTML 标签
-            markdown_parts.append(f"> {text_md}\n")
-
-        # 链接预览卡片
-        if link_preview:
-            preview_url = link_preview.get("url", "")
-            site_name = link_preview.get("site_name", "")
-            preview_title = link_preview.get("title", "")
-            preview_desc = link_preview.get("description", "")
-
-            markdown_parts.append("---")
-            markdown_parts.append("**引用链接**:")
-            if site_name:
-                markdown_parts.append(f"- **来源**: {site_name}")
-            if preview_title:
-                if preview_url:
-                    markdown_parts.append(f"- **标题**: [{preview_title}]({preview_url})")
-                else:
-                    markdown_parts.append(f"- **标题**: {preview_title}")
-            elif preview_url:
-                markdown_parts.append(f"- **链接**: {preview_url}")
-            if preview_desc:
-                markdown_parts.append(f"- **摘要**: {preview_desc}")
-            markdown_parts.append("---")
-            markdown_parts.append("")
-
-        # 作者信息
-        if author_name:
-            if author_link:
-                markdown_parts.append(f"**频道**: [{author_name}]({author_link})")
-            else:
-                markdown_parts.append(f"**频道**: {author_name}")
-
-        # 时间
-        if datetime_str:
-            markdown_parts.append(f"**发布时间**: {datetime_str}")
-
-        # 浏览量
-        if views:
-            markdown_parts.append(f"**浏览量**: {views}")
-
-        markdown_parts.append("")
-        markdown_parts.append(f"[查看原消息]({url})")
+        def _emit() -> Iterator[str]:
+            # 消息正文（保留原始 HTML 转换为 Markdown）
+            if text:
+                # 简单处理：将 <br> 转换为换行，再移除其他 HTML 标签
+                text_md = _TAG_RE.sub("", _BR_RE.sub("\n", text))
+                yield f"> {text_md}\n"
+
+            # 链接预览卡片
+            if link_preview:
+                preview_url = link_preview.get("url", "")
+                site_name = link_preview.get("site_name", "")
+                preview_title = link_preview.get("title", "")
+                preview_desc = link_preview.get("description", "")
+
+                yield "---"
+                yield "**引用链接**:"
+                if site_name:
+                    yield f"- **来源**: {site_name}"
+                if preview_title:
+                    yield (
+                        f"- **标题**: [{preview_title}]({preview_url})"
+                        if preview_url
+                        else f"- **标题**: {preview_title}"
+                    )
+                elif preview_url:
+                    yield f"- **链接**: {preview_url}"
+                if preview_desc:
+                    yield f"- **摘要**: {preview_desc}"
+                yield "---"
+                yield ""
+
+            # 作者信息
+            if author_name:
+                yield f"**频道**: [{author_name}]({author_link})" if author_link else f"**频道**: {author_name}"
+            if datetime_str:
+                yield f"**发布时间**: {datetime_str}"
+            if views:
+                yield f"**浏览量**: {views}"
+
+            yield ""
+            yield f"[查看原消息]({url})"
 
         # 纯文本版本：包含链接预览内容
         plain_parts = []
         if text:
-            plain_parts.append(re.sub(r"<[^>]+>", "", text))
+            plain_parts.append(stripped)
         if link_preview:
             preview_title = link_preview.get("title", "")
             preview_desc = link_preview.get("description", "")
@@ -237,7 +237,7 @@ class TelegramStrategy:
             final_url=final_url,
             title=title,
             text=plain_text,
-            markdown="\n".join(markdown_parts),
+            markdown="\n".join(_emit()),
             raw_html=html,
             article_html=f"<article>{''.join(article_parts)}</article>",
         )
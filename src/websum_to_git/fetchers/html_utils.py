@@ -3,60 +3,67 @@
 from __future__ import annotations
 
 import logging
-from urllib.parse import urljoin, urlparse
+import multiprocessing
+import re
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from urllib.parse import urljoin
 
 from bs4 import BeautifulSoup
-from markdownify import markdownify as md
+from markdownify import MarkdownConverter
 from readability import Document
 
-from .structs import ArticleData
+from .structs import ArticleData, FetchError
 
 logger = logging.getLogger(__name__)
 
+# 正文解析专用进程池：网络/浏览器等待留在各自的执行上下文，
+# 只有 CPU 密集的 Readability + markdownify 进入这个有界池；放在独立进程中执行，
+# 解析不再与事件循环和其他抓取线程争抢 GIL。
+_parser_pool: ProcessPoolExecutor | None = None
+_parser_pool_lock = threading.Lock()
 
-def html_to_markdown(html: str) -> str:
-    """将 HTML 转换为 Markdown 格式。
+# 需要补全为绝对地址的链接属性：标签名 -> 属性名
+_LINK_ATTRS = {"a": "href", "img": "src"}
+# 链接是否带 scheme（与 urlparse 的 scheme 判定规则一致），只做一次 C 层匹配，不构造 ParseResult
+_SCHEME_RE = re.compile(r"[A-Za-z][A-Za-z0-9+.-]*:")
+# 模块级复用同一个转换器：选项只解析一次，标签转换函数的查找缓存也能跨页面复用
+_MARKDOWN_CONVERTER = MarkdownConverter(
+    heading_style="ATX",  # 使用 # 风格标题
+    bullets="-",  # 使用 - 作为列表符号
+    code_language="",  # 不猜测代码语言
+    strip=["script", "style", "noscript"],  # 移除脚本和样式
+)
+
+
+def soup_to_markdown(soup: BeautifulSoup) -> str:
+    """将已解析的 HTML 文档树转换为 Markdown 格式。
+
+    直接遍历传入的 soup，避免先序列化为字符串再由 markdownify 重新解析一遍。
 
     Args:
-        html: HTML 内容
+        soup: 已解析的 BeautifulSoup 文档
 
     Returns:
         Markdown 格式的文本
     """
-    return md(
-        html,
-        heading_style="ATX",  # 使用 # 风格标题
-        bullets="-",  # 使用 - 作为列表符号
-        code_language="",  # 不猜测代码语言
-        strip=["script", "style", "noscript"],  # 移除脚本和样式
-    ).strip()
+    return _MARKDOWN_CONVERTER.convert_soup(soup).strip()
 
 
-def make_links_absolute(html: str, base_url: str) -> str:
-    """将 HTML 中的相对链接转换为绝对链接。
+def make_links_absolute(soup: BeautifulSoup, base_url: str) -> None:
+    """将文档树中的相对链接原地转换为绝对链接。
 
     Args:
-        html: 需要处理的 HTML 内容
+        soup: 需要处理的 BeautifulSoup 文档，直接在其上修改
         base_url: 用于解析相对链接的基础 URL
-
-    Returns:
-        处理后的 HTML，所有相对链接已转换为绝对链接
     """
-    soup = BeautifulSoup(html, "html.parser")
-
-    # 处理 <a> 标签的 href 属性
-    for tag in soup.find_all("a", href=True):
-        href = str(tag["href"])
-        if href and not urlparse(href).scheme:
-            tag["href"] = urljoin(base_url, href)
-
-    # 处理 <img> 标签的 src 属性
-    for tag in soup.find_all("img", src=True):
-        src = str(tag["src"])
-        if src and not urlparse(src).scheme:
-            tag["src"] = urljoin(base_url, src)
-
-    return str(soup)
+    # 一次遍历同时处理 <a> 的 href 与 <img> 的 src
+    for tag in soup.find_all(["a", "img"]):
+        attr = _LINK_ATTRS[tag.name]
+        value = str(tag.get(attr) or "")
+        if value and not _SCHEME_RE.match(value):
+            tag[attr] = urljoin(base_url, value)
 
 
 def extract_article(html: str, base_url: str) -> ArticleData:
@@ -76,18 +83,82 @@ def extract_article(html: str, base_url: str) -> ArticleData:
     article_html = doc.summary()
     logger.info("Readability 提取完成, 标题: %s, 文章 HTML 长度: %d", title, len(article_html))
 
-    # 将相对链接转换为绝对链接
-    article_html = make_links_absolute(article_html, base_url)
+    # 只解析一次：原地补全链接后，同一棵树依次序列化为 article_html、转换为 Markdown、提取纯文本
+    article_soup = BeautifulSoup(article_html, "lxml")
+    make_links_absolute(article_soup, base_url)
+    article_html = str(article_soup)
 
     # 转换为 Markdown
-    markdown = html_to_markdown(article_html)
+    markdown = soup_to_markdown(article_soup)
     logger.info("Markdown 转换完成, 长度: %d", len(markdown))
 
-    # 提取纯文本
-    article_soup = BeautifulSoup(article_html, "html.parser")
+    # 提取纯文本：仍用同一棵树，article_html 与 Markdown 均已生成，可以直接移除脚本和样式
     for tag in article_soup(["script", "style", "noscript"]):
         tag.decompose()
     text = article_soup.get_text(separator="\n", strip=True)
     logger.info("纯文本提取完成, 长度: %d", len(text))
 
     return ArticleData(title=title, article_html=article_html, markdown=markdown, text=text)
+
+
+def _get_parser_pool(max_workers: int) -> ProcessPoolExecutor:
+    """惰性创建解析进程池，大小以首次调用时的配置为准。
+
+    使用 spawn 启动子进程：调用方所在进程已有多个线程（浏览器池、调度线程池），fork 可能继承被占用的锁。
+    """
+
+    global _parser_pool
+
+    with _parser_pool_lock:
+        if _parser_pool is None:
+            _parser_pool = ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context("spawn"))
+        return _parser_pool
+
+
+def _discard_parser_pool(pool: ProcessPoolExecutor) -> None:
+    """丢弃已损坏的解析进程池（子进程被 OOM 杀死、lxml 崩溃等），下次调用时重新创建。"""
+
+    global _parser_pool
+
+    with _parser_pool_lock:
+        if _parser_pool is pool:
+            _parser_pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def close_parser_pool() -> None:
+    """关闭解析进程池（应用退出时调用）。"""
+
+    global _parser_pool
+
+    with _parser_pool_lock:
+        pool, _parser_pool = _parser_pool, None
+    if pool is not None:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def extract_article_bounded(html: str, base_url: str, *, max_workers: int) -> ArticleData:
+    """在有界解析进程池中执行 ``extract_article`` 并等待结果。
+
+    子进程异常退出会使整个进程池不可用：此时重建进程池并重试一次，仍失败则抛出 FetchError，
+    以便上层回退到其他抓取方式。
+
+    Args:
+        html: 完整的 HTML 内容
+        base_url: 用于解析相对链接的基础 URL
+        max_workers: 解析池大小（对应 ``http.parser_workers``）
+
+    Returns:
+        ArticleData 对象
+
+    Raises:
+        FetchError: 解析进程池重建后仍然崩溃时。
+    """
+    for attempt in range(2):
+        pool = _get_parser_pool(max_workers)
+        try:
+            return pool.submit(extract_article, html, base_url).result()
+        except BrokenProcessPool as exc:
+            logger.warning("解析进程池已损坏, 重建后重试 (第 %d 次): %s", attempt + 1, exc)
+            _discard_parser_pool(pool)
+    raise FetchError(f"正文解析进程异常退出: {base_url}")
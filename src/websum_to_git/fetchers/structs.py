@@ -3,9 +3,8 @@
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING
-
-from pydantic import BaseModel, ConfigDict, Field
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Literal
 
 # Defuddle 等 fetcher 可能返回的元数据字段名（按期望的 YAML 顺序排列）。
 # 统一在这里声明，方便 pipeline 组装 front matter 时复用。
@@ -19,6 +18,12 @@ EXTRA_META_KEYS: tuple[str, ...] = (
     "word_count",
 )
 
+# 滚动方式：True 直接跳到底部并强制加载懒加载资源；"incremental" 逐屏滚动（适合无限滚动页面）；False 不滚动
+ScrollMode = bool | Literal["incremental"]
+
+# 正文抽取不需要的子资源类型，默认在浏览器中直接拦截
+DEFAULT_BLOCKED_RESOURCES: frozenset[str] = frozenset({"image", "media", "font"})
+
 if TYPE_CHECKING:
     from websum_to_git.config import AppConfig
 
@@ -29,7 +34,8 @@ class FetchError(RuntimeError):
     """抓取过程中出现的异常。"""
 
 
-class ArticleData(BaseModel):
+@dataclass(slots=True)
+class ArticleData:
     """从 HTML 提取的文章数据。"""
 
     title: str = ""
@@ -38,7 +44,8 @@ class ArticleData(BaseModel):
     text: str = ""
 
 
-class PageContent(BaseModel):
+@dataclass(slots=True)
+class PageContent:
     """网页内容数据结构。
 
     Attributes:
@@ -51,8 +58,6 @@ class PageContent(BaseModel):
         article_html: 提取后的文章 HTML（Readability 处理后）
     """
 
-    model_config = ConfigDict(arbitrary_types_allowed=True)
-
     url: str
     final_url: str
     title: str
@@ -62,15 +67,18 @@ class PageContent(BaseModel):
     article_html: str
     # 由 fetcher 额外提供的元数据（如 defuddle 返回的 author/site/published 等），
     # pipeline 在生成最终 front matter 时会按需合并。
-    extra_meta: dict[str, str] = Field(default_factory=dict)
+    extra_meta: dict[str, str] = field(default_factory=dict)
 
 
-class HeadlessConfig(BaseModel):
+@dataclass(slots=True)
+class HeadlessConfig:
     """Headless 浏览器抓取配置。"""
 
-    timeout: int | None = Field(default=None, description="超时时间(秒)")
-    wait_selector: str | None = Field(default=None, description="等待出现的 CSS 选择器")
-    scroll: bool = Field(default=True, description="是否执行滚动操作")
+    timeout: int | None = None  # 超时时间(秒)
+    wait_selector: str | None = None  # 等待出现的 CSS 选择器
+    scroll: ScrollMode = True  # 滚动方式：True/False/"incremental"
+    wait_networkidle: bool = False  # 是否额外等待网络空闲
+    block_resources: frozenset[str] | None = DEFAULT_BLOCKED_RESOURCES  # 拦截的子资源类型，None 表示不拦截
 
 
 def get_common_config(config: AppConfig) -> tuple[int, bool]:
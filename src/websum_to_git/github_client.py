@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+import re
 from dataclasses import dataclass
 from datetime import datetime
 from typing import TYPE_CHECKING, cast
@@ -15,6 +16,9 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# 文件名中不安全的字符: \w 与 str.isalnum() 加下划线等价（含中文等 Unicode 字母数字）
+_UNSAFE_FILENAME_CHAR_RE = re.compile(r"[^\w-]")
+
 
 @dataclass
 class PublishResult:
@@ -44,7 +48,7 @@ class GitHubPublisher:
 
         now = datetime.now()
         timestamp_str = now.strftime("%Y%m%d-%H%M%S")
-        safe_title = "".join(c if c.isalnum() or c in "-_" else "-" for c in title)[:60] or "note"
+        safe_title = _UNSAFE_FILENAME_CHAR_RE.sub("-", title[:60]) or "note"
         filename = f"{timestamp_str}-{safe_title}.md"
 
         if self._config.target_dir:
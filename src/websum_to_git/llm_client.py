@@ -84,13 +84,22 @@ class LLMClient:
                     "reasoning_effort": "high",
                 }
             }
-        resp = self._client.chat.completions.create(
+        # 流式接收：长文本生成时服务端边生成边下发，避免整段响应在两端各缓冲一份
+        stream = self._client.chat.completions.create(
             model=self._config.model,
             messages=messages,
             temperature=1.0,
+            stream=True,
             **kwargs,
         )
-        return resp.choices[0].message.content or ""
+        parts: list[str] = []
+        for chunk in stream:
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta
+            if delta and delta.content:
+                parts.append(delta.content)
+        return "".join(parts)
 
     def _generate_with_openai_response(self, system_prompt: str | None, user_content: str) -> str:
         # OpenAI Responses API，支持新一代统一输入输出格式
@@ -25,6 +25,11 @@ logger = logging.getLogger(__name__)
 _PROMPTS_DIR = Path(__file__).parent / "prompts"
 _RATE_LIMIT_RETRY_WAIT_SECONDS = 120
 _RATE_LIMIT_MAX_ATTEMPTS = 2
+# 优先使用 libyaml 的 C 实现序列化 front matter，未编译 libyaml 时回退纯 Python 版本
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+# 中文检测用的字符类，模块加载时编译一次
+_CHINESE_CHAR_RE = re.compile(r"[\u4e00-\u9fff]")
+_WORD_CHAR_RE = re.compile(r"[a-zA-Z\u4e00-\u9fff]")
 
 
 def _load_prompt(name: str) -> str:
@@ -64,8 +69,9 @@ def _build_front_matter(page: PageContent, now: str, tags: list[str]) -> str:
             front_matter[key] = value.strip()
     front_matter["tags"] = tags
 
-    serialized = yaml.safe_dump(
+    serialized = yaml.dump(
         front_matter,
+        Dumper=_YAML_DUMPER,
         allow_unicode=True,
         default_flow_style=False,
         sort_keys=False,
@@ -139,18 +145,9 @@ class HtmlToObsidianPipeline:
         )
         logger.info("GitHub 发布成功, 文件路径: %s, commit: %s", github_result.file_path, github_result.commit_hash)
 
-        # 步骤 4: 上传到 Telegraph
+        # 步骤 4: 上传到 Telegraph。Telegraph 页面无法删除，必须在 GitHub 提交成功后再发布
         logger.info("步骤 4/4: 上传到 Telegraph")
-        telegraph_url: str | None = None
-        try:
-            telegraph_result = self._telegraph.publish_markdown(
-                title=summary_result.ai_title,
-                content=full_markdown,
-            )
-            telegraph_url = telegraph_result.url
-            logger.info("Telegraph 发布成功: %s", telegraph_url)
-        except Exception as exc:  # noqa: BLE001
-            logger.warning("Telegraph 发布失败 (非致命): %s", exc)
+        telegraph_url = self._publish_telegraph(title=summary_result.ai_title, content=full_markdown)
 
         return PipelineResult(
             file_path=github_result.file_path,
@@ -160,6 +157,16 @@ class HtmlToObsidianPipeline:
             summarized=not summary_result.skipped,
         )
 
+    def _publish_telegraph(self, *, title: str, content: str) -> str | None:
+        """发布到 Telegraph，失败不影响主流程，返回页面链接或 None。"""
+        try:
+            telegraph_result = self._telegraph.publish_markdown(title=title, content=content)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("Telegraph 发布失败 (非致命): %s", exc)
+            return None
+        logger.info("Telegraph 发布成功: %s", telegraph_result.url)
+        return telegraph_result.url
+
     def _generate_with_retry(self, client: LLMClient, *, system_prompt: str | None, user_content: str) -> str:
         """调用 LLM；若遇到 429，则等待 2 分钟后重试一次。"""
         for attempt in range(1, _RATE_LIMIT_MAX_ATTEMPTS + 1):
@@ -271,9 +278,9 @@ class HtmlToObsidianPipeline:
     def _is_chinese_text(self, text: str) -> bool:
         """检测文本是否主要为中文。"""
         # 统计中文字符数量
-        chinese_chars = len(re.findall(r"[\u4e00-\u9fff]", text))
+        chinese_chars = len(_CHINESE_CHAR_RE.findall(text))
         # 统计总字符数（排除空白和标点）
-        total_chars = len(re.findall(r"[a-zA-Z\u4e00-\u9fff]", text))
+        total_chars = len(_WORD_CHAR_RE.findall(text))
         # 如果中文字符绝对数量超过 45，则认为是中文（避免少量英文混入时误判为需翻译）
         if chinese_chars > 45:
             return True
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import inspect
 import logging
 from collections.abc import Awaitable, Callable
 from concurrent.futures import ThreadPoolExecutor
@@ -10,6 +11,7 @@ from typing import Any
 
 logger = logging.getLogger(__name__)
 
+# run 可以是同步函数（在受控线程池中执行），也可以是协程函数（直接在事件循环中 await）。
 RunFunc = Callable[[], Any]
 AsyncHandler = Callable[..., Awaitable[None]]
 
@@ -147,6 +149,15 @@ class TaskScheduler:
 
         self._executor.shutdown(wait=False, cancel_futures=True)
 
+    async def _run_job(self, job: Job) -> Any:
+        """执行任务主体：纯 I/O 的协程任务直接 await，阻塞任务才占用线程池。"""
+
+        if inspect.iscoroutinefunction(job.run):
+            return await job.run()
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, job.run)
+
     async def _chat_worker(self, chat_id: int) -> None:
         while True:
             async with self._lock:
@@ -168,8 +179,7 @@ class TaskScheduler:
                     if job.on_start:
                         await job.on_start()
 
-                    loop = asyncio.get_running_loop()
-                    result = await loop.run_in_executor(self._executor, job.run)
+                    result = await self._run_job(job)
 
                     if job.on_success:
                         await job.on_success(result)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 import logging
 import re
 import time
@@ -17,6 +18,23 @@ _RETRYABLE_STATUS_CODES = {500, 502, 503, 504}  # 可重试的 HTTP 状态码
 # Telegraph API 基础地址
 _API_BASE = "https://api.telegra.ph"
 
+# Markdown 转换用的正则，模块加载时编译一次，逐行处理时直接复用
+_FRONT_MATTER_RE = re.compile(r"^---\n.*?\n---\n", re.DOTALL)
+_HEADING_PREFIX_RE = re.compile(r"^#+\s*")
+_HR_RE = re.compile(r"^[-*_]{3,}$")
+_BULLET_RE = re.compile(r"^[-*+]\s+")
+_ORDERED_RE = re.compile(r"^\d+\.\s+")
+# 行内格式: (正则, 替换模板)，按顺序依次应用
+_INLINE_SUBS = (
+    (re.compile(r"\[([^\]]+)\]\([^)]+\)"), r"\1"),  # 链接，保留文本
+    (re.compile(r"!\[([^\]]*)\]\([^)]+\)"), r"[图片: \1]"),  # 图片
+    (re.compile(r"\*\*([^*]+)\*\*"), r"\1"),  # 加粗
+    (re.compile(r"__([^_]+)__"), r"\1"),
+    (re.compile(r"\*([^*]+)\*"), r"\1"),  # 斜体
+    (re.compile(r"_([^_]+)_"), r"\1"),
+    (re.compile(r"`([^`]+)`"), r"\1"),  # 行内代码
+)
+
 
 @dataclass
 class TelegraphResult:
@@ -159,7 +177,7 @@ class TelegraphClient:
             Telegraph 兼容的 HTML 内容 (JSON 字符串格式)
         """
         # 移除 YAML front matter
-        markdown = re.sub(r"^---\n.*?\n---\n", "", markdown, flags=re.DOTALL)
+        markdown = _FRONT_MATTER_RE.sub("", markdown)
 
         # 分行处理
         lines = markdown.strip().split("\n")
@@ -197,21 +215,21 @@ class TelegraphClient:
                 nodes.append({"tag": "h4", "children": [self._process_inline(line[4:])]})
             elif line.startswith("#### ") or line.startswith("##### ") or line.startswith("###### "):
                 # h4+ 都转为 h4
-                text = re.sub(r"^#+\s*", "", line)
+                text = _HEADING_PREFIX_RE.sub("", line)
                 nodes.append({"tag": "h4", "children": [self._process_inline(text)]})
             # 处理分隔线
-            elif re.match(r"^[-*_]{3,}$", line.strip()):
+            elif _HR_RE.match(line.strip()):
                 nodes.append({"tag": "hr"})
             # 处理引用
             elif line.startswith("> "):
                 nodes.append({"tag": "blockquote", "children": [self._process_inline(line[2:])]})
             # 处理无序列表 (简化处理)
-            elif re.match(r"^[-*+]\s+", line):
-                text = re.sub(r"^[-*+]\s+", "", line)
+            elif _BULLET_RE.match(line):
+                text = _BULLET_RE.sub("", line)
                 nodes.append({"tag": "p", "children": ["• " + self._process_inline(text)]})
             # 处理有序列表
-            elif re.match(r"^\d+\.\s+", line):
-                text = re.sub(r"^\d+\.\s+", "", line)
+            elif _ORDERED_RE.match(line):
+                text = _ORDERED_RE.sub("", line)
                 nodes.append({"tag": "p", "children": [self._process_inline(text)]})
             # 普通段落
             else:
@@ -222,10 +240,8 @@ class TelegraphClient:
             code_text = "\n".join(code_block_lines)
             nodes.append({"tag": "pre", "children": [code_text]})
 
-        # 转换为 JSON 字符串
-        import json
-
-        return json.dumps(nodes, ensure_ascii=False)
+        # 转换为紧凑 JSON 字符串，减少表单请求体体积
+        return json.dumps(nodes, ensure_ascii=False, separators=(",", ":"))
 
     def _process_inline(self, text: str) -> str:
         """处理行内 Markdown 格式，简化版本只保留纯文本。
@@ -236,16 +252,6 @@ class TelegraphClient:
         Returns:
             处理后的文本
         """
-        # 移除链接格式，保留文本
-        text = re.sub(r"\[([^\]]+)\]\([^)]+\)", r"\1", text)
-        # 移除图片
-        text = re.sub(r"!\[([^\]]*)\]\([^)]+\)", r"[图片: \1]", text)
-        # 移除加粗
-        text = re.sub(r"\*\*([^*]+)\*\*", r"\1", text)
-        text = re.sub(r"__([^_]+)__", r"\1", text)
-        # 移除斜体
-        text = re.sub(r"\*([^*]+)\*", r"\1", text)
-        text = re.sub(r"_([^_]+)_", r"\1", text)
-        # 移除行内代码
-        text = re.sub(r"`([^`]+)`", r"\1", text)
+        for pattern, repl in _INLINE_SUBS:
+            text = pattern.sub(repl, text)
         return text.strip()
@@ -1,5 +1,8 @@
 from types import SimpleNamespace
 
+import pytest
+
+from websum_to_git.fetchers import camoufox_helper
 from websum_to_git.fetchers.camoufox_helper import get_camoufox_browser_version
 
 
@@ -18,3 +21,158 @@ def test_get_camoufox_browser_version_returns_not_installed_when_no_active(monke
     monkeypatch.setattr("camoufox.multiversion.list_installed", lambda: [])
 
     assert get_camoufox_browser_version() == "未安装"
+
+
+class _FakeContext:
+    def storage_state(self) -> dict[str, list[object]]:
+        return {"cookies": [], "origins": []}
+
+
+class _FakeBrowser:
+    def is_connected(self) -> bool:
+        return True
+
+    def new_context(self, **_: object) -> _FakeContext:
+        return _FakeContext()
+
+
+@pytest.fixture
+def launches(monkeypatch) -> list[_FakeBrowser]:
+    """用假的 Camoufox 代替真实浏览器，返回每次启动的浏览器列表。"""
+    launched: list[_FakeBrowser] = []
+
+    class FakeCamoufox:
+        def __init__(self, **_: object) -> None:
+            self.browser = _FakeBrowser()
+
+        def __enter__(self) -> _FakeBrowser:
+            launched.append(self.browser)
+            return self.browser
+
+        def __exit__(self, *_: object) -> None:
+            return None
+
+    monkeypatch.setattr(camoufox_helper, "_ensure_camoufox", lambda: (FakeCamoufox, None))
+    return launched
+
+
+def test_browser_pool_reuses_launched_browser(launches) -> None:
+    pool = camoufox_helper._BrowserPool(1)
+    try:
+        first = pool.run(lambda context: context)
+        second = pool.run(lambda context: context)
+    finally:
+        pool.close()
+
+    assert first is second
+    assert len(launches) == 1
+
+
+def test_browser_pool_warm_up_launches_every_browser(launches) -> None:
+    pool = camoufox_helper._BrowserPool(2)
+    try:
+        for future in pool.warm_up():
+            future.result(timeout=5)
+    finally:
+        pool.close()
+
+    assert len(launches) == 2
+
+
+def test_browser_pool_closes_half_started_browser_when_launch_fails(launches, monkeypatch) -> None:
+    fake_cls, _ = camoufox_helper._ensure_camoufox()
+    exits: list[object] = []
+
+    class FailingCamoufox(fake_cls):
+        def __enter__(self) -> _FakeBrowser:
+            super().__enter__()
+            raise RuntimeError("launch failed")
+
+        def __exit__(self, *_: object) -> None:
+            exits.append(self)
+
+    classes = iter([FailingCamoufox, fake_cls])
+    monkeypatch.setattr(camoufox_helper, "_ensure_camoufox", lambda: (next(classes), None))
+    pool = camoufox_helper._BrowserPool(1)
+    try:
+        with pytest.raises(RuntimeError, match="launch failed"):
+            pool.run(lambda context: context)
+        assert pool.run(lambda context: context) is not None
+    finally:
+        pool.close()
+
+    assert len(exits) == 1
+    assert len(launches) == 2
+
+
+def test_browser_pool_relaunches_when_context_creation_fails(launches, monkeypatch) -> None:
+    failures = [RuntimeError("context failed")]
+
+    def new_context(self: _FakeBrowser, **_: object) -> _FakeContext:
+        if failures:
+            raise failures.pop()
+        return _FakeContext()
+
+    monkeypatch.setattr(_FakeBrowser, "new_context", new_context)
+    pool = camoufox_helper._BrowserPool(1)
+    try:
+        with pytest.raises(RuntimeError, match="context failed"):
+            pool.run(lambda context: context)
+        assert isinstance(pool.run(lambda context: context), _FakeContext)
+    finally:
+        pool.close()
+
+    assert len(launches) == 2
+
+
+def test_browser_pool_restores_storage_state_in_memory_after_restart(launches, monkeypatch) -> None:
+    restored: list[object] = []
+
+    def new_context(self: _FakeBrowser, **kwargs: object) -> _FakeContext:
+        restored.append(kwargs.get("storage_state"))
+        return _FakeContext()
+
+    monkeypatch.setattr(_FakeBrowser, "new_context", new_context)
+    monkeypatch.setattr(camoufox_helper, "_MAX_PAGES_PER_BROWSER", 1)
+    pool = camoufox_helper._BrowserPool(1)
+    try:
+        pool.run(lambda context: context)
+        pool.run(lambda context: context)
+    finally:
+        pool.close()
+
+    assert len(launches) == 2
+    assert restored == [None, {"cookies": [], "origins": []}]
+
+
+def test_close_camoufox_resets_browser_pool() -> None:
+    pool = camoufox_helper._get_browser_pool(1)
+
+    camoufox_helper.close_camoufox()
+
+    assert camoufox_helper._get_browser_pool(1) is not pool
+    camoufox_helper.close_camoufox()
+
+
+def test_compact_js_strips_indentation_and_comment_lines() -> None:
+    js = """
+    () => {
+        // 注释
+        const a = 1;  // 行尾注释保留
+
+        return a
+    }
+    """
+
+    assert camoufox_helper.compact_js(js) == "() => {\nconst a = 1;  // 行尾注释保留\nreturn a\n}"
+
+
+def test_blocked_url_pattern_matches_only_blocked_extensions() -> None:
+    pattern = camoufox_helper._blocked_url_pattern(frozenset({"image", "font"}))
+
+    assert pattern is not None
+    assert pattern.search("https://example.com/a.JPG?w=100")
+    assert pattern.search("https://example.com/font.woff2")
+    assert not pattern.search("https://example.com/app.js")
+    assert not pattern.search("https://example.com/video.mp4")
+    assert camoufox_helper._blocked_url_pattern(frozenset({"stylesheet"})) is None
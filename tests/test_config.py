@@ -2,27 +2,35 @@ from textwrap import dedent
 
 from websum_to_git.config import load_config
 
+_MINIMAL_CONFIG = dedent(
+    """
+    telegram:
+      bot_token: "token"
+    llm:
+      provider: "openai"
+      api_key: "key"
+      model: "model"
+    github:
+      repo: "owner/repo"
+      pat: "pat"
+    """
+).strip()
+
 
 def test_load_config_defaults_to_defuddle_enabled_and_strip_tracking(tmp_path) -> None:
     config_path = tmp_path / "config.yaml"
-    config_path.write_text(
-        dedent(
-            """
-            telegram:
-              bot_token: "token"
-            llm:
-              provider: "openai"
-              api_key: "key"
-              model: "model"
-            github:
-              repo: "owner/repo"
-              pat: "pat"
-            """
-        ).strip(),
-        encoding="utf-8",
-    )
+    config_path.write_text(_MINIMAL_CONFIG, encoding="utf-8")
 
     config = load_config(config_path)
 
     assert config.defuddle.enabled is True
     assert config.defuddle.strip_tracking is True
+    assert config.http.parser_workers == 2
+    assert config.http.browser_workers == 2
+
+
+def test_load_config_reuses_parsed_config_for_unchanged_file(tmp_path) -> None:
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text(_MINIMAL_CONFIG, encoding="utf-8")
+
+    assert load_config(config_path) is load_config(str(config_path))
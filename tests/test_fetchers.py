@@ -1,6 +1,14 @@
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+import requests
+
 import websum_to_git.fetchers as fetchers
 from websum_to_git.config import AppConfig, DefuddleConfig, GitHubConfig, HttpConfig, LLMConfig, TelegramConfig
-from websum_to_git.fetchers import FetchError, PageContent
+from websum_to_git.fetchers import FetchError, PageContent, html_utils
 
 
 def _build_config(*, defuddle_enabled: bool) -> AppConfig:
@@ -13,6 +21,11 @@ def _build_config(*, defuddle_enabled: bool) -> AppConfig:
     )
 
 
+@pytest.fixture(autouse=True)
+def _clear_page_cache() -> None:
+    fetchers._page_cache.clear()
+
+
 def _build_page(url: str, final_url: str, markdown: str) -> PageContent:
     return PageContent(
         url=url,
@@ -106,3 +119,93 @@ def test_fetch_page_reraises_headless_error_when_fallback_unavailable(monkeypatc
         assert str(exc) == "Headless 抓取失败: 缺少 Camoufox bundle"
     else:
         raise AssertionError("预期抛出 FetchError")
+
+
+def test_fetch_page_reuses_cached_result(monkeypatch) -> None:
+    config = _build_config(defuddle_enabled=False)
+    calls: list[str] = []
+
+    def fake_headless(url: str, _: AppConfig) -> PageContent:
+        calls.append(url)
+        return _build_page(url=url, final_url=url, markdown="x" * 600)
+
+    monkeypatch.setattr(fetchers, "fetch_headless", fake_headless)
+
+    first = fetchers.fetch_page("https://example.com/article?utm_source=telegram", config)
+    first.markdown = "mutated"
+    second = fetchers.fetch_page("https://example.com/article", config)
+
+    assert calls == ["https://example.com/article"]
+    assert second.markdown == "x" * 600
+
+
+def test_match_route_dispatches_by_host() -> None:
+    assert fetchers._match_route("https://gist.github.com/user/abc") is fetchers.fetch_github
+    assert fetchers._match_route("https://github.com/owner/repo") is fetchers.fetch_github
+    assert fetchers._match_route("https://example.com/article") is None
+
+
+def test_fetch_page_skips_cache_when_ttl_is_zero(monkeypatch) -> None:
+    config = _build_config(defuddle_enabled=False)
+    config.http.page_cache_ttl = 0
+    calls: list[str] = []
+
+    def fake_headless(url: str, _: AppConfig) -> PageContent:
+        calls.append(url)
+        return _build_page(url=url, final_url=url, markdown="x" * 600)
+
+    monkeypatch.setattr(fetchers, "fetch_headless", fake_headless)
+
+    fetchers.fetch_page("https://example.com/article", config)
+    fetchers.fetch_page("https://example.com/article", config)
+
+    assert calls == ["https://example.com/article", "https://example.com/article"]
+
+
+def test_fetch_defuddle_decodes_undeclared_charset_as_utf8(monkeypatch) -> None:
+    from websum_to_git.fetchers import defuddle
+
+    response = requests.Response()
+    response.status_code = 200
+    response.headers["Content-Type"] = "text/markdown"
+    response._content = "---\ntitle: 标题\n---\n正文内容".encode()
+    response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+    monkeypatch.setattr(defuddle._session, "get", lambda *_args, **_kwargs: response)
+
+    page = defuddle.fetch_defuddle("https://example.com/a", _build_config(defuddle_enabled=True))
+
+    assert page.title == "标题"
+    assert page.markdown == "正文内容"
+
+
+def test_fetch_defuddle_falls_back_to_utf8_for_unknown_charset(monkeypatch) -> None:
+    from websum_to_git.fetchers import defuddle
+
+    response = requests.Response()
+    response.status_code = 200
+    response.headers["Content-Type"] = "text/markdown; charset=x-unknown"
+    response._content = "---\ntitle: 标题\n---\n正文内容".encode()
+    response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+    monkeypatch.setattr(defuddle._session, "get", lambda *_args, **_kwargs: response)
+
+    page = defuddle.fetch_defuddle("https://example.com/a", _build_config(defuddle_enabled=True))
+
+    assert page.title == "标题"
+    assert page.markdown == "正文内容"
+
+
+def test_extract_article_bounded_rebuilds_broken_parser_pool() -> None:
+    broken = ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn"))
+    with pytest.raises(BrokenProcessPool):
+        broken.submit(os._exit, 1).result()
+    html_utils._parser_pool = broken
+    try:
+        article = html_utils.extract_article_bounded(
+            "<html><head><title>T</title></head><body><p>hello</p></body></html>",
+            "https://example.com/",
+            max_workers=1,
+        )
+        assert "hello" in article.text
+        assert html_utils._parser_pool is not broken
+    finally:
+        html_utils.close_parser_pool()
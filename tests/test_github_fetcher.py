@@ -0,0 +1,156 @@
+from types import SimpleNamespace
+
+import pytest
+
+from websum_to_git.config import AppConfig, GitHubConfig, HttpConfig, LLMConfig, TelegramConfig
+from websum_to_git.fetchers import github as github_fetcher
+from websum_to_git.fetchers.github import _ROUTE_RE, GitHubFetcher
+
+
+@pytest.mark.parametrize(
+    ("url", "route"),
+    [
+        ("https://gist.github.com/user/0123abcd", "gist"),
+        ("https://github.com/owner/repo/blob/main/src/app.py", "file"),
+        ("https://github.com/owner/repo/issues/12", "issue"),
+        ("https://github.com/owner/repo/pull/34", "issue"),
+        ("https://github.com/owner/repo", "repo"),
+        ("https://github.com/owner/repo/tree/main/docs", "repo"),
+    ],
+)
+def test_route_re_dispatches_to_expected_route(url: str, route: str) -> None:
+    match = _ROUTE_RE.match(url)
+
+    assert match is not None
+    assert match.lastgroup == route
+
+
+def test_route_re_keeps_route_groups() -> None:
+    match = _ROUTE_RE.match("https://github.com/owner/repo/pull/34")
+
+    assert match is not None
+    assert match.group("issue_owner", "issue_repo", "issue_type", "issue_number") == ("owner", "repo", "pull", "34")
+
+
+def test_route_re_rejects_unsupported_url() -> None:
+    assert _ROUTE_RE.match("https://github.com/owner/repo/actions/runs/1") is None
+
+
+def _build_fetcher() -> GitHubFetcher:
+    config = AppConfig(
+        telegram=TelegramConfig(bot_token="token"),
+        llm=LLMConfig(provider="openai", api_key="key", model="model"),
+        github=GitHubConfig(repo="owner/repo", pat="pat"),
+        http=HttpConfig(),
+    )
+    return GitHubFetcher(config)
+
+
+def test_fetch_issue_or_pr_uses_single_graphql_query() -> None:
+    fetcher = _build_fetcher()
+    calls: list[dict[str, object]] = []
+
+    def graphql_query(_query: str, variables: dict[str, object]) -> tuple[dict, dict]:
+        calls.append(variables)
+        item = {
+            "__typename": "PullRequest",
+            "title": "Add feature",
+            "body": "PR body",
+            "state": "MERGED",
+            "createdAt": "2024-01-02T03:04:05Z",
+            "author": {"login": "alice"},
+            "labels": {"nodes": [{"name": "enhancement"}]},
+            "comments": {"nodes": [{"author": None, "body": "LGTM"}]},
+        }
+        return {}, {"data": {"repository": {"issueOrPullRequest": item}}}
+
+    fetcher._github = SimpleNamespace(requester=SimpleNamespace(graphql_query=graphql_query))
+
+    page = fetcher.fetch("https://github.com/owner/repo/pull/34")
+
+    assert calls == [{"owner": "owner", "name": "repo", "number": 34}]
+    assert page.title == "Add feature · PR #34 · owner/repo"
+    assert "**状态**: merged | **作者**: @alice" in page.markdown
+    assert "### @unknown\n\nLGTM" in page.markdown
+
+
+def test_get_repo_reuses_cached_repository() -> None:
+    github_fetcher._repo_cache.clear()
+    fetcher = _build_fetcher()
+    calls: list[str] = []
+
+    def get_repo(slug: str) -> object:
+        calls.append(slug)
+        return SimpleNamespace(full_name=slug)
+
+    fetcher._github = SimpleNamespace(get_repo=get_repo)
+
+    first = fetcher._get_repo("owner", "repo")
+    second = fetcher._get_repo("owner", "repo")
+
+    assert first is second
+    assert calls == ["owner/repo"]
+    github_fetcher._repo_cache.clear()
+
+
+def test_fetchers_share_github_client() -> None:
+    assert _build_fetcher()._github is _build_fetcher()._github
+
+
+def test_fetch_file_requests_raw_content() -> None:
+    github_fetcher._raw_cache.clear()
+    fetcher = _build_fetcher()
+    requests_made: list[tuple[str, dict[str, object], dict[str, str]]] = []
+
+    def request_json(_verb: str, url: str, parameters: dict[str, object], headers: dict[str, str]) -> tuple:
+        requests_made.append((url, parameters, headers))
+        return 200, {"content-type": "application/vnd.github.raw"}, "print('hi')\n"
+
+    fetcher._github = SimpleNamespace(requester=SimpleNamespace(requestJson=request_json))
+
+    page = fetcher.fetch("https://github.com/owner/repo/blob/main/src/app.py")
+
+    assert requests_made == [
+        ("/repos/owner/repo/contents/src/app.py", {"ref": "main"}, {"Accept": "application/vnd.github.raw"})
+    ]
+    assert page.text == "print('hi')\n"
+    assert "```python\nprint('hi')\n" in page.markdown
+
+
+def test_get_raw_reuses_cached_content_on_not_modified() -> None:
+    github_fetcher._raw_cache.clear()
+    fetcher = _build_fetcher()
+    sent_headers: list[dict[str, str]] = []
+    responses = [
+        (200, {"etag": '"abc"', "content-type": "application/vnd.github.raw"}, "# Title\n"),
+        (304, {"etag": '"abc"'}, ""),
+    ]
+
+    def request_json(_verb: str, _url: str, parameters: object, headers: dict[str, str]) -> tuple:
+        sent_headers.append(headers)
+        return responses.pop(0)
+
+    fetcher._github = SimpleNamespace(requester=SimpleNamespace(requestJson=request_json))
+
+    first = fetcher._get_raw("/repos/owner/repo/readme")
+    second = fetcher._get_raw("/repos/owner/repo/readme")
+
+    assert "If-None-Match" not in sent_headers[0]
+    assert sent_headers[1]["If-None-Match"] == '"abc"'
+    assert second == first == (200, first[1], "# Title\n")
+    github_fetcher._raw_cache.clear()
+
+
+def test_get_raw_skips_caching_large_content(monkeypatch) -> None:
+    github_fetcher._raw_cache.clear()
+    monkeypatch.setattr(github_fetcher, "_RAW_CACHE_MAX_CONTENT_CHARS", 4)
+    fetcher = _build_fetcher()
+
+    def request_json(_verb: str, _url: str, parameters: object, headers: dict[str, str]) -> tuple:
+        return 200, {"etag": '"abc"'}, "too long"
+
+    fetcher._github = SimpleNamespace(requester=SimpleNamespace(requestJson=request_json))
+
+    fetcher._get_raw("/repos/owner/repo/readme")
+
+    assert len(github_fetcher._raw_cache) == 0
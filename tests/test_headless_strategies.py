@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+from websum_to_git.fetchers.headless_strategies import get_route
+
+
+@pytest.mark.parametrize(
+    ("url", "name"),
+    [
+        ("https://x.com/user/status/1", "TwitterStrategy"),
+        ("https://mobile.twitter.com/user/status/1", "TwitterStrategy"),
+        ("https://t.me/channel/123", "TelegramStrategy"),
+        ("https://demo.hf.space/", "process_huggingface"),
+    ],
+)
+def test_get_route_matches_host_and_subdomains(url: str, name: str) -> None:
+    route = get_route(url)
+
+    assert route is not None
+    assert route.name == name
+
+
+def test_get_route_ignores_pattern_outside_host() -> None:
+    assert get_route("https://example.org/?next=https://x.com/") is None
+    assert get_route("https://abbott.me/post") is None
+
+
+def test_route_registration_clears_host_cache() -> None:
+    from websum_to_git.fetchers.headless_strategies import registry
+
+    assert get_route("https://cache-test.invalid/") is None
+
+    @registry.route("cache-test.invalid")
+    def process_cache_test(_page: object) -> None:
+        pass
+
+    try:
+        route = get_route("https://cache-test.invalid/")
+        assert route is not None
+        assert route.name == "process_cache_test"
+    finally:
+        del registry._HOST_ROUTES["cache-test.invalid"]
+        registry._lookup_host.cache_clear()
+
+
+def test_telegram_extract_checks_embed_frame_first() -> None:
+    from websum_to_git.fetchers.headless_strategies.telegram import TelegramStrategy
+
+    evaluated: list[str] = []
+
+    class FakeFrame:
+        def __init__(self, url: str, found: bool) -> None:
+            self.url = url
+            self._found = found
+
+        def evaluate(self, _script: str) -> dict:
+            evaluated.append(self.url)
+            return {"found": self._found, "text": "hello"}
+
+    frames = [
+        FakeFrame("https://t.me/channel/1", False),
+        FakeFrame("https://ads.example.com/frame", False),
+        FakeFrame("https://t.me/channel/1?embed=1&mode=tme", True),
+    ]
+
+    data = TelegramStrategy.extract(SimpleNamespace(frames=frames))
+
+    assert data["text"] == "hello"
+    assert evaluated == ["https://t.me/channel/1?embed=1&mode=tme"]
+
+
+def test_telegram_build_title_uses_text_without_tags() -> None:
+    from websum_to_git.fetchers.headless_strategies.telegram import TelegramStrategy
+
+    text = '<a href="https://example.com/very/long/link">' + "x" * 60 + "</a>"
+    page = TelegramStrategy.build("https://t.me/c/1", "https://t.me/c/1", "", {"text": text, "author_name": "Ch"})
+
+    assert page.title == "Ch: " + "x" * 50 + "..."
+    assert page.text == "x" * 60
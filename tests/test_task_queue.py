@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from datetime import datetime
+
+from websum_to_git.task_queue import Job, TaskScheduler
+
+
+def _build_scheduler() -> TaskScheduler:
+    return TaskScheduler(max_concurrent_jobs=1, max_queue_size=5, max_queue_size_per_chat=5)
+
+
+async def _run_single_job(scheduler: TaskScheduler, run) -> object:
+    done: asyncio.Future[object] = asyncio.get_running_loop().create_future()
+
+    async def on_success(result: object) -> None:
+        done.set_result(result)
+
+    async def on_failure(exc: Exception) -> None:
+        done.set_exception(exc)
+
+    job = Job(
+        job_id="job",
+        chat_id=1,
+        status_message_id=1,
+        created_at=datetime.now(),
+        kind="test",
+        run=run,
+        on_success=on_success,
+        on_failure=on_failure,
+    )
+    await scheduler.enqueue(job)
+    try:
+        return await asyncio.wait_for(done, timeout=5)
+    finally:
+        await scheduler.shutdown()
+
+
+async def test_sync_job_runs_in_worker_thread() -> None:
+    result = await _run_single_job(_build_scheduler(), lambda: threading.current_thread().name)
+
+    assert str(result).startswith("websum-job")
+
+
+async def test_async_job_runs_on_event_loop() -> None:
+    async def run() -> str:
+        return threading.current_thread().name
+
+    result = await _run_single_job(_build_scheduler(), run)
+
+    assert result == threading.current_thread().name